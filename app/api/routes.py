@@ -1,42 +1,71 @@
+import hmac
 import logging
-from datetime import datetime, timezone
+import time
 
+import msgspec
+import orjson
 from fastapi import APIRouter, Header, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
 
-from app.core.settings import get_settings
+from app.core.settings import get_frozen_settings
 
 router = APIRouter()
-settings = get_settings()
+settings = get_frozen_settings()
 logger = logging.getLogger(__name__)
 
+# Bound once at import time: pydantic-settings attribute access is not free
+# and these values never change within a process.
+_WEBHOOK_SECRET_BYTES = settings.telegram_webhook_secret.encode()
+_MAX_UPDATE_AGE_SECONDS = settings.webhook_max_update_age_seconds
 
-def _extract_update_timestamp(update: dict) -> int | None:
-    for key in ("message", "edited_message", "channel_post", "edited_channel_post"):
-        payload = update.get(key)
-        if isinstance(payload, dict):
-            ts = payload.get("date")
-            if isinstance(ts, int):
-                return ts
+
+class _MessageLite(msgspec.Struct):
+    date: int | None = None
+
+
+class _UpdateLite(msgspec.Struct):
+    """Only the fields needed for the dedup/staleness drop decision.
+
+    msgspec parses straight into the struct and ignores the rest of the
+    payload, so dropped updates never pay a full decode.
+    """
+
+    update_id: int | None = None
+    message: _MessageLite | None = None
+    edited_message: _MessageLite | None = None
+    channel_post: _MessageLite | None = None
+    edited_channel_post: _MessageLite | None = None
+
+
+_update_lite_decoder = msgspec.json.Decoder(_UpdateLite)
+
+
+def _extract_update_timestamp(update: _UpdateLite) -> int | None:
+    # Fast path: nearly all updates are plain messages.
+    payload = update.message or update.edited_message or update.channel_post or update.edited_channel_post
+    if payload is not None:
+        return payload.date
     return None
 
 
-@router.get("/healthz")
-async def healthcheck() -> dict[str, str]:
-    return {"status": "ok"}
+@router.get("/healthz", response_model=None)
+async def healthcheck() -> ORJSONResponse:
+    return ORJSONResponse({"status": "ok"})
 
 
-@router.post(settings.telegram_webhook_path)
+@router.post(settings.telegram_webhook_path, response_model=None)
 async def telegram_webhook(
     request: Request,
     x_telegram_bot_api_secret_token: str | None = Header(default=None),
-) -> dict[str, bool]:
+) -> ORJSONResponse:
     if settings.telegram_delivery_mode != "webhook":
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Webhook endpoint is disabled in polling mode",
         )
 
-    if x_telegram_bot_api_secret_token != settings.telegram_webhook_secret:
+    token = (x_telegram_bot_api_secret_token or "").encode()
+    if not hmac.compare_digest(token, _WEBHOOK_SECRET_BYTES):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid webhook secret")
 
     dispatcher = request.app.state.dispatcher
@@ -47,17 +76,18 @@ async def telegram_webhook(
             detail="Telegram runtime is disabled due to invalid bot token",
         )
     dedup = request.app.state.webhook_dedup
-    update = await request.json()
-    ts = _extract_update_timestamp(update)
+    body = await request.body()
+    lite = _update_lite_decoder.decode(body)
+    ts = _extract_update_timestamp(lite)
     if ts is not None:
-        age = int(datetime.now(timezone.utc).timestamp()) - ts
-        if age > settings.webhook_max_update_age_seconds:
+        age = int(time.time()) - ts
+        if age > _MAX_UPDATE_AGE_SECONDS:
             logger.info("Stale update skipped: age_seconds=%s", age)
-            return {"ok": True}
-    update_id = update.get("update_id")
-    if isinstance(update_id, int):
+            return ORJSONResponse({"ok": True})
+    update_id = lite.update_id
+    if update_id is not None:
         if not dedup.mark_seen(update_id):
             logger.info("Duplicate webhook update skipped: update_id=%s", update_id)
-            return {"ok": True}
-    await dispatcher.feed_raw_update(bot=bot, update=update)
-    return {"ok": True}
+            return ORJSONResponse({"ok": True})
+    await dispatcher.feed_raw_update(bot=bot, update=orjson.loads(body))
+    return ORJSONResponse({"ok": True})
@@ -2,10 +2,11 @@ from datetime import datetime, timedelta
 
 
 INTERNAL_PRE_REMINDER_PREFIX = "__pre1h__::"
+_PREFIX_LEN = len(INTERNAL_PRE_REMINDER_PREFIX)
 
 
 def build_pre_reminder_text(user_text: str) -> str:
-    return f"{INTERNAL_PRE_REMINDER_PREFIX}{user_text}"
+    return INTERNAL_PRE_REMINDER_PREFIX + user_text
 
 
 def is_internal_pre_reminder(text: str) -> bool:
@@ -13,9 +14,7 @@ def is_internal_pre_reminder(text: str) -> bool:
 
 
 def unwrap_internal_text(text: str) -> str:
-    if is_internal_pre_reminder(text):
-        return text[len(INTERNAL_PRE_REMINDER_PREFIX) :]
-    return text
+    return text[_PREFIX_LEN:] if text.startswith(INTERNAL_PRE_REMINDER_PREFIX) else text
 
 
 def should_create_pre_reminder(*, run_at_utc: datetime, now_local: datetime) -> bool:
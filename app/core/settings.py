@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from functools import lru_cache
 from typing import Literal
 
@@ -27,7 +28,7 @@ class Settings(BaseSettings):
     openai_api_key: str = Field(default="replace_me")
     openai_model: str = Field(default="gpt-4.1-mini")
     llm_timeout_seconds: float = Field(default=20.0, gt=0)
-    llm_max_attempts: int = Field(default=1, ge=1)
+    llm_max_attempts: int = Field(default=3, ge=1)
     stt_provider: Literal["openai", "http", "groq"] = Field(default="openai")
     openai_transcription_model: str = Field(default="gpt-4o-mini-transcribe")
     stt_http_url: str = Field(default="http://127.0.0.1:18100/transcribe")
@@ -57,6 +58,65 @@ class Settings(BaseSettings):
         return self.telegram_bot_token
 
 
+@dataclass(slots=True, frozen=True)
+class FrozenSettings:
+    """Immutable snapshot of Settings for hot paths.
+
+    Attribute access on a slotted dataclass is a plain C-slot load, unlike
+    pydantic model attribute access. Built once from the validated Settings.
+    """
+
+    app_name: str
+    app_env: str
+    app_host: str
+    app_port: int
+    app_timezone: str
+    telegram_bot_token: str
+    telegram_bot_token_test: str | None
+    telegram_use_test_bot: bool
+    telegram_webhook_secret: str
+    telegram_webhook_path: str
+    telegram_delivery_mode: Literal["webhook", "polling"]
+    telegram_polling_drop_pending_updates: bool
+    database_url: str
+    llm_provider: Literal["openai", "deepseek"]
+    openai_api_key: str
+    openai_model: str
+    llm_timeout_seconds: float
+    llm_max_attempts: int
+    stt_provider: Literal["openai", "http", "groq"]
+    openai_transcription_model: str
+    stt_http_url: str
+    stt_http_timeout_seconds: float
+    groq_api_key: str | None
+    groq_stt_base_url: str
+    groq_stt_model: str
+    groq_stt_language: str
+    groq_stt_timeout_seconds: float
+    deepseek_api_key: str | None
+    deepseek_base_url: str
+    deepseek_model: str
+    openai_monthly_budget_usd: float
+    openai_estimated_input_cost_per_1k: float
+    openai_estimated_output_cost_per_1k: float
+    app_log_level: str
+    chat_rate_limit_requests: int
+    chat_rate_limit_window_seconds: int
+    llm_circuit_failure_threshold: int
+    llm_circuit_open_seconds: int
+    webhook_max_update_age_seconds: int
+    telegram_active_bot_token: str
+
+
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
     return Settings()
+
+
+@lru_cache(maxsize=1)
+def get_frozen_settings() -> FrozenSettings:
+    settings = get_settings()
+    return FrozenSettings(
+        **settings.model_dump(),
+        telegram_active_bot_token=settings.telegram_active_bot_token,
+    )
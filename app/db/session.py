@@ -1,21 +1,58 @@
 import asyncio
+import logging
 import sys
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.core.settings import get_settings
+from app.core.settings import get_frozen_settings
 
-settings = get_settings()
+settings = get_frozen_settings()
 
 if sys.platform == "win32":
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
 database_url = settings.database_url
-if sys.platform == "win32" and database_url.startswith("postgresql+psycopg://"):
-    # psycopg async can fail under Windows event loop modes depending on runtime startup path.
-    # asyncpg is robust for this environment.
+if database_url.startswith("postgresql+psycopg://"):
+    # asyncpg is the fastest async Postgres driver and is robust across
+    # event loop policies (including Windows startup paths).
     database_url = database_url.replace("postgresql+psycopg://", "postgresql+asyncpg://", 1)
 
-engine = create_async_engine(database_url, future=True, echo=False)
+engine = create_async_engine(
+    database_url,
+    future=True,
+    echo=False,
+    pool_size=20,
+    max_overflow=10,
+    pool_pre_ping=True,
+    insertmanyvalues_page_size=1000,
+)
 SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# Dedicated tiny pool for background jobs so scheduler ticks never compete
+# with webhook traffic for connections.
+background_engine = create_async_engine(
+    database_url,
+    future=True,
+    echo=False,
+    pool_size=2,
+    max_overflow=0,
+    pool_recycle=300,
+)
+BackgroundSession = async_sessionmaker(background_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def warm_db_pool(connections: int = 5) -> None:
+    """Pre-create pool connections so first requests do not pay connect cost."""
+
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.gather(*(_ping() for _ in range(connections)))
+    except Exception:
+        logging.getLogger(__name__).warning(
+            "Database pool warm-up failed; connections will be created lazily"
+        )
+
@@ -1,4 +1,7 @@
-SYSTEM_PROMPT_RU = """
+import sys
+
+
+SYSTEM_PROMPT_RU = sys.intern("""
 Legacy final-command prompt. The primary production prompt is SEMANTIC_DRAFT_PROMPT_RU.
 
 You are an assistant for a Telegram reminder bot.
@@ -40,10 +43,10 @@ Examples:
 {"command":"list_reminders","mode":"today"}
 {"command":"create_reminders","reminders":[{"text":"купить молоко","day_reference":"tomorrow","time":"10:00","explicit_time_provided":true}]}
 {"command":"delete_reminders","mode":"filter","reminder_id":20}
-""".strip()
+""".strip())
 
 
-SEMANTIC_DRAFT_PROMPT_RU = """
+SEMANTIC_DRAFT_PROMPT_RU = sys.intern("""
 You are an assistant for a Telegram reminder bot. Return exactly one strict JSON object only.
 
 Architecture:
@@ -136,4 +139,4 @@ Create examples if current local datetime is 2026-05-25T13:06:00+03:00:
 - "Завтра напомни, что встреча в пятницу в 15" -> {"intent":"create_reminders","create_items":[{"reminder_text":"встреча в пятницу в 15","schedule":{"kind":"once","start_at":"2026-05-26T08:00:00+03:00","end_at":null,"frequency":null,"interval":null,"weekdays":null,"month_day":null},"day_expression":"завтра","time_expression":null,"date_expression":null,"period_start_expression":null,"period_end_expression":null,"recurrence_expression":null,"recurrence_until_expression":null,"recurrence_interval":null,"pre_reminder_expression":null,"raw_context":"Завтра напомни, что встреча в пятницу в 15"}],"passthrough_command":null}
 - "Сегодня с 13.00 по 18.00 каждые полчаса создать напоминание пить воду" -> {"intent":"create_reminders","create_items":[{"reminder_text":"пить воду","schedule":{"kind":"recurring","start_at":"2026-05-25T13:00:00+03:00","end_at":"2026-05-25T18:00:00+03:00","frequency":"minutely","interval":30,"weekdays":null,"month_day":null},"day_expression":"сегодня","time_expression":null,"date_expression":"2026-05-25","period_start_expression":"2026-05-25T13:00:00+03:00","period_end_expression":"2026-05-25T18:00:00+03:00","recurrence_expression":"каждые полчаса","recurrence_until_expression":"2026-05-25T18:00:00+03:00","recurrence_interval":30,"pre_reminder_expression":null,"raw_context":"Сегодня с 13.00 по 18.00 каждые полчаса создать напоминание пить воду"}],"passthrough_command":null}
 - "Каждые 30 минут завтра с 10 до 12 проверять воду" -> {"intent":"create_reminders","create_items":[{"reminder_text":"проверять воду","schedule":{"kind":"recurring","start_at":"2026-05-26T10:00:00+03:00","end_at":"2026-05-26T12:00:00+03:00","frequency":"minutely","interval":30,"weekdays":null,"month_day":null},"day_expression":"завтра","time_expression":null,"date_expression":"2026-05-26","period_start_expression":"2026-05-26T10:00:00+03:00","period_end_expression":"2026-05-26T12:00:00+03:00","recurrence_expression":"каждые 30 минут","recurrence_until_expression":"2026-05-26T12:00:00+03:00","recurrence_interval":30,"pre_reminder_expression":null,"raw_context":"Каждые 30 минут завтра с 10 до 12 проверять воду"}],"passthrough_command":null}
-""".strip()
+""".strip())
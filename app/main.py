@@ -6,14 +6,18 @@ from contextlib import asynccontextmanager
 from contextlib import suppress
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from aiogram.utils.token import TokenValidationError
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from app.api.routes import router as api_router
 from app.core.settings import get_settings
+from app.db.session import warm_db_pool
 from app.observability.logging_config import configure_logging
 from app.services.cost_control import MonthlyCostGuard
-from app.services.reminder_dispatcher import dispatch_due_reminders
+from app.services.reminder_dispatcher import dispatch_due_reminders, listen_for_due_reminders
+from app.services.retention import purge_finished_reminders
+from app.services.series_materializer import materialize_series_occurrences
 from app.services.webhook_dedup import WebhookDeduplicator
 from app.telegram.runtime import build_bot, build_dispatcher
 
@@ -27,6 +31,12 @@ if sys.platform == "win32":
 async def lifespan(app: FastAPI):
     settings = get_settings()
     configure_logging(settings.app_log_level)
+    # Eager tasks (3.12+) run new coroutines up to their first await
+    # inline, so per-update work that finishes synchronously (dedup
+    # rejects, rate-limit rejects) never pays a scheduling round trip.
+    eager_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_factory)
     bot = None
     dispatcher = None
     try:
@@ -39,7 +49,11 @@ async def lifespan(app: FastAPI):
     app.state.polling_task = None
     scheduler = AsyncIOScheduler(timezone="UTC")
     app.state.scheduler = scheduler
+    app.state.due_listener_task = None
     if bot is not None:
+        # The NOTIFY trigger only fires for rows written when already due
+        # within 15s; pre-scheduled reminders rely on this poll at the
+        # moment they become due, so it stays at the 15s latency budget.
         scheduler.add_job(
             dispatch_due_reminders,
             "interval",
@@ -50,7 +64,29 @@ async def lifespan(app: FastAPI):
             id="due-reminders-dispatch",
             replace_existing=True,
         )
+        # Slide the recurring-series expansion window well before it drains
+        # (window is days, interval is hours).
+        scheduler.add_job(
+            materialize_series_occurrences,
+            "interval",
+            hours=6,
+            max_instances=1,
+            coalesce=True,
+            id="series-top-up",
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            purge_finished_reminders,
+            "interval",
+            hours=24,
+            max_instances=1,
+            coalesce=True,
+            id="finished-retention-purge",
+            replace_existing=True,
+        )
         scheduler.start()
+        app.state.due_listener_task = create_task(listen_for_due_reminders(bot))
+    await warm_db_pool()
     app.state.webhook_dedup = WebhookDeduplicator()
     app.state.cost_guard = MonthlyCostGuard(
         monthly_usd_limit=settings.openai_monthly_budget_usd,
@@ -78,6 +114,11 @@ async def lifespan(app: FastAPI):
             polling_task.cancel()
             with suppress(CancelledError):
                 await polling_task
+        due_listener_task = getattr(app.state, "due_listener_task", None)
+        if due_listener_task is not None:
+            due_listener_task.cancel()
+            with suppress(CancelledError):
+                await due_listener_task
         scheduler = getattr(app.state, "scheduler", None)
         if scheduler is not None and scheduler.running:
             scheduler.shutdown(wait=False)
@@ -88,7 +129,7 @@ async def lifespan(app: FastAPI):
 
 def create_app() -> FastAPI:
     settings = get_settings()
-    app = FastAPI(title=settings.app_name, lifespan=lifespan)
+    app = FastAPI(title=settings.app_name, lifespan=lifespan, default_response_class=ORJSONResponse)
     app.include_router(api_router)
     return app
 
@@ -1,7 +1,9 @@
 from datetime import datetime
 from enum import Enum
+from uuid import UUID
 
-from sqlalchemy import DateTime, Enum as SqlEnum, String, Text
+from sqlalchemy import DateTime, Enum as SqlEnum, Index, String, Text, false, text
+from sqlalchemy.dialects.postgresql import UUID as PgUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -16,19 +18,43 @@ class ReminderStatus(str, Enum):
 
 class Reminder(Base):
     __tablename__ = "reminders"
+    __table_args__ = (
+        Index("ix_reminders_chat_runat_id", "chat_id", "run_at", "id"),
+        Index("ix_reminders_chat_status_runat", "chat_id", "status", "run_at"),
+        Index("ix_reminders_due", "run_at", "id", postgresql_where=text("status = 'pending'")),
+        Index(
+            "ix_reminders_chat_pending",
+            "chat_id",
+            "run_at",
+            postgresql_where=text("status <> 'deleted'"),
+        ),
+        Index(
+            "ix_reminders_user_visible",
+            "chat_id",
+            "run_at",
+            postgresql_where=text("is_internal = false"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    chat_id: Mapped[int] = mapped_column(index=True)
+    chat_id: Mapped[int] = mapped_column()
     text: Mapped[str] = mapped_column(Text, nullable=False)
-    run_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+    run_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     status: Mapped[ReminderStatus] = mapped_column(
         SqlEnum(ReminderStatus, name="reminder_status"),
         default=ReminderStatus.pending,
         nullable=False,
     )
+    is_internal: Mapped[bool] = mapped_column(default=False, server_default=false(), nullable=False)
     recurrence_rule: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    series_id: Mapped[str | None] = mapped_column(String(36), nullable=True, index=True)
+    series_id: Mapped[UUID | None] = mapped_column(PgUUID(as_uuid=True), nullable=True, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
-    )
+    # Stamped by the set_updated_at trigger (migration 0013); no Python-side
+    # onupdate so UPDATE statements skip the column.
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+
+    @property
+    def status_value(self) -> str:
+        """Plain string form of status; the enum column guarantees the type,
+        so callers need no per-row isinstance check."""
+        return self.status.value
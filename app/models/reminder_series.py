@@ -1,6 +1,8 @@
 from datetime import datetime
+from uuid import UUID
 
 from sqlalchemy import BigInteger, DateTime, String, Text
+from sqlalchemy.dialects.postgresql import UUID as PgUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -9,11 +11,13 @@ from app.db.base import Base
 class ReminderSeries(Base):
     __tablename__ = "reminder_series"
 
-    series_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    series_id: Mapped[UUID] = mapped_column(PgUUID(as_uuid=True), primary_key=True)
     chat_id: Mapped[int] = mapped_column(BigInteger, nullable=False, index=True)
     source_text: Mapped[str] = mapped_column(Text, nullable=False)
     recurrence_rule: Mapped[str] = mapped_column(String(255), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    # Stamped by the set_updated_at trigger (migration 0013); no Python-side
+    # onupdate so UPDATE statements skip the column.
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime(timezone=True), default=datetime.utcnow, nullable=False
     )
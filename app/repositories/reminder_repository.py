@@ -1,24 +1,253 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
+from functools import lru_cache
+from uuid import UUID
 
-from sqlalchemy import insert, select, update
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    bindparam,
+    column,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.internal_reminders import INTERNAL_PRE_REMINDER_PREFIX
+from app.core.internal_reminders import is_internal_pre_reminder
 from app.models.reminder_action import ReminderAction
 from app.models.reminder import Reminder, ReminderStatus
 from app.models.reminder_series import ReminderSeries
 
+# Statements that do not vary per call are built once at import so every
+# execution hits SQLAlchemy's compiled-statement cache with the same object.
+_INSERT_REMINDER = insert(Reminder).returning(Reminder)
+_INSERT_SERIES = insert(ReminderSeries).returning(ReminderSeries)
+_INSERT_ACTION = insert(ReminderAction)
+_MARK_DELETED = (
+    update(Reminder)
+    .where(Reminder.id.in_(bindparam("ids", expanding=True)))
+    .values(status=ReminderStatus.deleted)
+)
+_MARK_DONE = (
+    update(Reminder)
+    .where(Reminder.id.in_(bindparam("ids", expanding=True)))
+    .values(status=ReminderStatus.done)
+)
+_LIST_DUE_PENDING = (
+    select(Reminder)
+    .where(Reminder.status == ReminderStatus.pending, Reminder.run_at <= bindparam("until_dt"))
+    .order_by(Reminder.run_at.asc(), Reminder.id.asc())
+    .limit(bindparam("limit_n"))
+    # SKIP LOCKED lets concurrent dispatcher workers claim disjoint rows
+    # instead of queuing on each other's locks.
+    .with_for_update(skip_locked=True)
+)
+# Series whose latest materialized occurrence falls short of the sliding
+# expansion window; series_materializer extends these.
+_SERIES_FRONTIERS = (
+    select(
+        ReminderSeries.series_id,
+        ReminderSeries.chat_id,
+        ReminderSeries.source_text,
+        ReminderSeries.recurrence_rule,
+        func.max(Reminder.run_at).label("last_run_at"),
+    )
+    .join(Reminder, Reminder.series_id == ReminderSeries.series_id)
+    .where(Reminder.status != ReminderStatus.deleted)
+    .group_by(ReminderSeries.series_id)
+    .having(func.max(Reminder.run_at) < bindparam("horizon_end"))
+)
+_ITER_DUE_PENDING = (
+    select(Reminder)
+    .where(Reminder.status == ReminderStatus.pending, Reminder.run_at <= bindparam("until_dt"))
+    .order_by(Reminder.run_at.asc(), Reminder.id.asc())
+    .with_for_update(skip_locked=True)
+)
+
+# Finished rows older than the retention window only grow the table and
+# its indexes; the retention job deletes them outright.
+_PURGE_FINISHED = delete(Reminder).where(
+    Reminder.status.in_((ReminderStatus.done, ReminderStatus.deleted)),
+    Reminder.run_at < bindparam("cutoff_dt"),
+)
+
+# Cap on one IN (...) expansion so bulk status updates keep a bounded
+# planner cost and never hold locks on an unbounded number of rows.
+_UPDATE_CHUNK_SIZE = 500
+
+# Bit flags for the optional list filters.  Each combination yields one
+# bindparam-only statement, built once and reused, so a hot filter shape
+# always re-executes the same prepared plan.
+_F_ID = 1 << 0
+_F_STATUS = 1 << 1
+_F_DELETED = 1 << 2
+_F_SEARCH = 1 << 3
+_F_FROM = 1 << 4
+_F_TO = 1 << 5
+_F_TO_EXCL = 1 << 6
+
+
+@lru_cache(maxsize=None)
+def _build_list_stmt(mask: int, order_desc: bool, with_limit: bool):
+    stmt = select(Reminder).where(
+        Reminder.chat_id == bindparam("chat_id"),
+        Reminder.is_internal.is_(False),
+    )
+    if mask & _F_ID:
+        stmt = stmt.where(Reminder.id == bindparam("reminder_id"))
+    if mask & _F_STATUS:
+        stmt = stmt.where(Reminder.status == bindparam("status_value"))
+    elif not mask & _F_DELETED:
+        stmt = stmt.where(Reminder.status != ReminderStatus.deleted)
+    if mask & _F_SEARCH:
+        stmt = stmt.where(Reminder.text.ilike(bindparam("search_pattern")))
+    if mask & _F_FROM:
+        stmt = stmt.where(Reminder.run_at >= bindparam("from_dt"))
+    if mask & _F_TO:
+        stmt = stmt.where(Reminder.run_at <= bindparam("to_dt"))
+    elif mask & _F_TO_EXCL:
+        stmt = stmt.where(Reminder.run_at < bindparam("to_dt"))
+    if order_desc:
+        stmt = stmt.order_by(Reminder.run_at.desc(), Reminder.id.desc())
+    else:
+        stmt = stmt.order_by(Reminder.run_at.asc(), Reminder.id.asc())
+    if with_limit:
+        stmt = stmt.limit(bindparam("limit_n"))
+    return stmt
+
+
+def _filters_mask_and_params(
+    chat_id: int,
+    *,
+    reminder_id: int | None,
+    status: str | None,
+    search_text: str | None,
+    from_dt: datetime | None,
+    to_dt: datetime | None,
+    include_deleted: bool,
+    to_dt_exclusive: bool = False,
+) -> tuple[int, dict]:
+    mask = 0
+    params: dict = {"chat_id": chat_id}
+    if reminder_id is not None:
+        mask |= _F_ID
+        params["reminder_id"] = reminder_id
+    if status:
+        mask |= _F_STATUS
+        params["status_value"] = ReminderStatus(status)
+    elif include_deleted:
+        mask |= _F_DELETED
+    if search_text:
+        mask |= _F_SEARCH
+        params["search_pattern"] = f"%{search_text}%"
+    if from_dt:
+        mask |= _F_FROM
+        params["from_dt"] = from_dt
+    if to_dt:
+        mask |= _F_TO_EXCL if to_dt_exclusive else _F_TO
+        params["to_dt"] = to_dt
+    return mask, params
+
+
+def _list_stmt_and_params(
+    chat_id: int,
+    *,
+    reminder_id: int | None,
+    status: str | None,
+    search_text: str | None,
+    from_dt: datetime | None,
+    to_dt: datetime | None,
+    include_deleted: bool,
+    to_dt_exclusive: bool = False,
+    order_desc: bool = False,
+    limit: int | None = None,
+):
+    mask, params = _filters_mask_and_params(
+        chat_id,
+        reminder_id=reminder_id,
+        status=status,
+        search_text=search_text,
+        from_dt=from_dt,
+        to_dt=to_dt,
+        include_deleted=include_deleted,
+        to_dt_exclusive=to_dt_exclusive,
+    )
+    if limit is not None:
+        params["limit_n"] = limit
+    return _build_list_stmt(mask, order_desc, limit is not None), params
+
+
+@lru_cache(maxsize=None)
+def _build_delete_stmt(mask: int, with_last_n: bool):
+    if with_last_n:
+        # Newest-n victims come from the ordered/limited list statement,
+        # reduced to ids; one UPDATE consumes the subquery directly.
+        victims = _build_list_stmt(mask, True, True).with_only_columns(Reminder.id)
+        stmt = update(Reminder).where(Reminder.id.in_(victims))
+    else:
+        stmt = update(Reminder).where(
+            Reminder.chat_id == bindparam("chat_id"),
+            Reminder.is_internal.is_(False),
+        )
+        if mask & _F_ID:
+            stmt = stmt.where(Reminder.id == bindparam("reminder_id"))
+        if mask & _F_STATUS:
+            stmt = stmt.where(Reminder.status == bindparam("status_value"))
+        elif not mask & _F_DELETED:
+            stmt = stmt.where(Reminder.status != ReminderStatus.deleted)
+        if mask & _F_SEARCH:
+            stmt = stmt.where(Reminder.text.ilike(bindparam("search_pattern")))
+        if mask & _F_FROM:
+            stmt = stmt.where(Reminder.run_at >= bindparam("from_dt"))
+        if mask & _F_TO:
+            stmt = stmt.where(Reminder.run_at <= bindparam("to_dt"))
+    return stmt.values(status=ReminderStatus.deleted).returning(
+        Reminder.id, Reminder.text, Reminder.run_at, Reminder.recurrence_rule
+    )
+
 
 class ReminderRepository:
+    """Data access for reminders.
+
+    Methods execute statements on the session but never commit: the caller
+    owns the transaction boundary, so one user action (e.g. create several
+    reminders plus an action log row) costs a single commit.
+    """
+
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
     async def create_many(self, items: Sequence[dict]) -> list[Reminder]:
-        stmt = insert(Reminder).returning(Reminder)
-        result = await self._session.execute(stmt, list(items))
-        await self._session.commit()
-        return list(result.scalars().all())
+        rows = []
+        for item in items:
+            row = dict(item)
+            row.setdefault("is_internal", is_internal_pre_reminder(row["text"]))
+            rows.append(row)
+        # Single multi-row INSERT ... RETURNING via insertmanyvalues; the
+        # caller owns the enclosing unit of work and its single commit.
+        result = await self._session.execute(_INSERT_REMINDER, rows)
+        return result.scalars().all()
+
+    async def create_many_ids(self, items: Sequence[dict]) -> list[tuple[int, datetime]]:
+        """Lean bulk insert returning (id, run_at) tuples in insert order.
+
+        Skips ORM object hydration for callers that already hold the row
+        payloads and only need the generated ids back.
+        """
+        rows = []
+        for item in items:
+            row = dict(item)
+            row.setdefault("is_internal", is_internal_pre_reminder(row["text"]))
+            rows.append(row)
+        stmt = insert(Reminder).returning(
+            Reminder.id, Reminder.run_at, sort_by_parameter_order=True
+        )
+        result = await self._session.execute(stmt, rows)
+        return [(row.id, row.run_at) for row in result]
 
     async def create_one(
         self,
@@ -26,34 +255,36 @@ class ReminderRepository:
         text: str,
         run_at,
         recurrence_rule: str | None = None,
-        series_id: str | None = None,
+        series_id: UUID | None = None,
         status: ReminderStatus = ReminderStatus.pending,
     ) -> Reminder:
-        created = await self.create_many(
-            [
-                {
-                    "chat_id": chat_id,
-                    "text": text,
-                    "run_at": run_at,
-                    "recurrence_rule": recurrence_rule,
-                    "series_id": series_id,
-                    "status": status,
-                }
-            ]
+        # Single-row insert avoids the executemany parameter-binding path.
+        stmt = (
+            insert(Reminder)
+            .values(
+                chat_id=chat_id,
+                text=text,
+                run_at=run_at,
+                recurrence_rule=recurrence_rule,
+                series_id=series_id,
+                status=status,
+                is_internal=is_internal_pre_reminder(text),
+            )
+            .returning(Reminder)
         )
-        return created[0]
+        result = await self._session.execute(stmt)
+        return result.scalar_one()
 
     async def create_series(
         self,
         *,
-        series_id: str,
+        series_id: UUID,
         chat_id: int,
         source_text: str,
         recurrence_rule: str,
     ) -> ReminderSeries:
-        stmt = insert(ReminderSeries).returning(ReminderSeries)
         result = await self._session.execute(
-            stmt,
+            _INSERT_SERIES,
             {
                 "series_id": series_id,
                 "chat_id": chat_id,
@@ -61,9 +292,22 @@ class ReminderRepository:
                 "recurrence_rule": recurrence_rule,
             },
         )
-        await self._session.commit()
         return result.scalar_one()
 
+    async def purge_finished_before(self, cutoff_dt: datetime) -> int:
+        """Delete done/deleted rows older than ``cutoff_dt``; returns count."""
+        result = await self._session.execute(_PURGE_FINISHED, {"cutoff_dt": cutoff_dt})
+        return result.rowcount or 0
+
+    async def list_series_frontiers(self, horizon_end: datetime) -> list:
+        """Series whose newest occurrence lies before ``horizon_end``.
+
+        Returns (series_id, chat_id, source_text, recurrence_rule,
+        last_run_at) rows for the materializer to extend.
+        """
+        result = await self._session.execute(_SERIES_FRONTIERS, {"horizon_end": horizon_end})
+        return result.all()
+
     async def log_action(
         self,
         *,
@@ -75,9 +319,8 @@ class ReminderRepository:
         parsed_command: dict | None,
         result_stats: dict | None,
     ) -> None:
-        stmt = insert(ReminderAction)
         await self._session.execute(
-            stmt,
+            _INSERT_ACTION,
             {
                 "action_id": action_id,
                 "chat_id": chat_id,
@@ -88,7 +331,6 @@ class ReminderRepository:
                 "result_stats": result_stats,
             },
         )
-        await self._session.commit()
 
     async def list_items(
         self,
@@ -100,28 +342,46 @@ class ReminderRepository:
         from_dt: datetime | None = None,
         to_dt: datetime | None = None,
         include_deleted: bool = False,
+        to_dt_exclusive: bool = False,
     ) -> list[Reminder]:
-        stmt = select(Reminder).where(
-            Reminder.chat_id == chat_id,
-            ~Reminder.text.startswith(INTERNAL_PRE_REMINDER_PREFIX),
+        stmt, params = _list_stmt_and_params(
+            chat_id,
+            reminder_id=reminder_id,
+            status=status,
+            search_text=search_text,
+            from_dt=from_dt,
+            to_dt=to_dt,
+            include_deleted=include_deleted,
+            to_dt_exclusive=to_dt_exclusive,
         )
+        result = await self._session.execute(stmt, params)
+        return result.scalars().all()
 
-        if reminder_id is not None:
-            stmt = stmt.where(Reminder.id == reminder_id)
-        if status:
-            stmt = stmt.where(Reminder.status == ReminderStatus(status))
-        elif not include_deleted:
-            stmt = stmt.where(Reminder.status != ReminderStatus.deleted)
-        if search_text:
-            stmt = stmt.where(Reminder.text.ilike(f"%{search_text}%"))
-        if from_dt:
-            stmt = stmt.where(Reminder.run_at >= from_dt)
-        if to_dt:
-            stmt = stmt.where(Reminder.run_at <= to_dt)
-
-        stmt = stmt.order_by(Reminder.run_at.asc(), Reminder.id.asc())
-        result = await self._session.execute(stmt)
-        return list(result.scalars().all())
+    async def stream_items(
+        self,
+        chat_id: int,
+        *,
+        reminder_id: int | None = None,
+        status: str | None = None,
+        search_text: str | None = None,
+        from_dt: datetime | None = None,
+        to_dt: datetime | None = None,
+        include_deleted: bool = False,
+    ) -> AsyncIterator[Reminder]:
+        """Same filters as list_items, but yields rows without materializing
+        the full result list — callers can chunk large listings lazily."""
+        stmt, params = _list_stmt_and_params(
+            chat_id,
+            reminder_id=reminder_id,
+            status=status,
+            search_text=search_text,
+            from_dt=from_dt,
+            to_dt=to_dt,
+            include_deleted=include_deleted,
+        )
+        result = await self._session.stream_scalars(stmt, params)
+        async for item in result:
+            yield item
 
     async def list_last_n(
         self,
@@ -134,69 +394,106 @@ class ReminderRepository:
         from_dt: datetime | None = None,
         to_dt: datetime | None = None,
         include_deleted: bool = False,
+        to_dt_exclusive: bool = False,
     ) -> list[Reminder]:
-        stmt = select(Reminder).where(
-            Reminder.chat_id == chat_id,
-            ~Reminder.text.startswith(INTERNAL_PRE_REMINDER_PREFIX),
+        stmt, params = _list_stmt_and_params(
+            chat_id,
+            reminder_id=reminder_id,
+            status=status,
+            search_text=search_text,
+            from_dt=from_dt,
+            to_dt=to_dt,
+            include_deleted=include_deleted,
+            to_dt_exclusive=to_dt_exclusive,
+            order_desc=True,
+            limit=n,
         )
-
-        if reminder_id is not None:
-            stmt = stmt.where(Reminder.id == reminder_id)
-        if status:
-            stmt = stmt.where(Reminder.status == ReminderStatus(status))
-        elif not include_deleted:
-            stmt = stmt.where(Reminder.status != ReminderStatus.deleted)
-        if search_text:
-            stmt = stmt.where(Reminder.text.ilike(f"%{search_text}%"))
-        if from_dt:
-            stmt = stmt.where(Reminder.run_at >= from_dt)
-        if to_dt:
-            stmt = stmt.where(Reminder.run_at <= to_dt)
-
-        stmt = stmt.order_by(Reminder.run_at.desc(), Reminder.id.desc()).limit(n)
-        result = await self._session.execute(stmt)
-        return list(result.scalars().all())
+        result = await self._session.execute(stmt, params)
+        return result.scalars().all()
 
     async def delete_by_ids(self, reminder_ids: list[int]) -> int:
-        if not reminder_ids:
-            return 0
-        stmt = (
-            update(Reminder)
-            .where(Reminder.id.in_(reminder_ids))
-            .values(status=ReminderStatus.deleted)
+        return await self._update_status_chunked(_MARK_DELETED, reminder_ids)
+
+    async def delete_returning(
+        self,
+        chat_id: int,
+        *,
+        reminder_id: int | None = None,
+        status: str | None = None,
+        search_text: str | None = None,
+        from_dt: datetime | None = None,
+        to_dt: datetime | None = None,
+        last_n: int | None = None,
+    ) -> list:
+        """Soft-delete matching rows and return them in one round trip.
+
+        Replaces the select-then-delete pair, which both doubled latency
+        and left a window for concurrent updates between the two.
+        """
+        mask, params = _filters_mask_and_params(
+            chat_id,
+            reminder_id=reminder_id,
+            status=status,
+            search_text=search_text,
+            from_dt=from_dt,
+            to_dt=to_dt,
+            include_deleted=False,
         )
-        result = await self._session.execute(stmt)
-        await self._session.commit()
-        return result.rowcount or 0
+        if last_n is not None:
+            params["limit_n"] = last_n
+        result = await self._session.execute(_build_delete_stmt(mask, last_n is not None), params)
+        return result.all()
 
     async def list_due_pending(self, until_dt: datetime, limit: int = 100) -> list[Reminder]:
-        stmt = (
-            select(Reminder)
-            .where(Reminder.status == ReminderStatus.pending, Reminder.run_at <= until_dt)
-            .order_by(Reminder.run_at.asc(), Reminder.id.asc())
-            .limit(limit)
+        result = await self._session.execute(
+            _LIST_DUE_PENDING, {"until_dt": until_dt, "limit_n": limit}
         )
-        result = await self._session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
+
+    async def iter_due_pending(self, until_dt: datetime, chunk: int = 100) -> AsyncIterator[Reminder]:
+        """Stream due rows through a server-side cursor in ``chunk`` pieces.
+
+        Lets the dispatcher start sending while a large backlog (e.g. after
+        an outage) is still being fetched, instead of materializing it all.
+        """
+        result = await self._session.stream_scalars(
+            _ITER_DUE_PENDING.execution_options(yield_per=chunk), {"until_dt": until_dt}
+        )
+        async for item in result:
+            yield item
 
     async def mark_done(self, reminder_ids: list[int]) -> int:
-        if not reminder_ids:
-            return 0
+        return await self._update_status_chunked(_MARK_DONE, reminder_ids)
+
+    async def _update_status_chunked(self, stmt, reminder_ids: list[int]) -> int:
+        changed = 0
+        for start in range(0, len(reminder_ids), _UPDATE_CHUNK_SIZE):
+            chunk = reminder_ids[start : start + _UPDATE_CHUNK_SIZE]
+            result = await self._session.execute(stmt, {"ids": chunk})
+            changed += result.rowcount or 0
+        return changed
+
+    async def reschedule(self, reminder_id: int, next_run_at: datetime) -> int:
         stmt = (
             update(Reminder)
-            .where(Reminder.id.in_(reminder_ids))
-            .values(status=ReminderStatus.done)
+            .where(Reminder.id == reminder_id)
+            .values(run_at=next_run_at, status=ReminderStatus.pending)
         )
         result = await self._session.execute(stmt)
-        await self._session.commit()
         return result.rowcount or 0
 
-    async def reschedule(self, reminder_id: int, next_run_at: datetime) -> int:
+    async def reschedule_many(self, updates: list[tuple[int, datetime]]) -> int:
+        if not updates:
+            return 0
+        next_runs = values(
+            column("id", Integer),
+            column("run_at", DateTime(timezone=True)),
+            name="next_runs",
+        ).data(updates)
         stmt = (
             update(Reminder)
-            .where(Reminder.id == reminder_id)
-            .values(run_at=next_run_at, status=ReminderStatus.pending)
+            .where(Reminder.id == next_runs.c.id)
+            .values(run_at=next_runs.c.run_at, status=ReminderStatus.pending)
         )
         result = await self._session.execute(stmt)
-        await self._session.commit()
         return result.rowcount or 0
@@ -2,10 +2,33 @@
 
 from datetime import date, datetime, time, timedelta, timezone
 from enum import Enum
+from types import MappingProxyType
 from typing import Annotated, Literal
 
 from pydantic import AliasChoices, BaseModel, Field, TypeAdapter, model_validator
 
+_WEEKDAY_MAP = MappingProxyType(
+    {
+        "monday": 0,
+        "tuesday": 1,
+        "wednesday": 2,
+        "thursday": 3,
+        "friday": 4,
+        "saturday": 5,
+        "sunday": 6,
+        "понедельник": 0,
+        "вторник": 1,
+        "среда": 2,
+        "среду": 2,
+        "четверг": 3,
+        "пятница": 4,
+        "пятницу": 4,
+        "суббота": 5,
+        "субботу": 5,
+        "воскресенье": 6,
+    }
+)
+
 
 class CommandName(str, Enum):
     create = "create_reminders"
@@ -55,28 +78,9 @@ class ReminderInput(BaseModel):
     def normalize_weekday(cls, data: dict) -> dict:
         value = data.get("weekday")
         if isinstance(value, str):
-            normalized = value.strip().lower()
-            weekdays = {
-                "monday": 0,
-                "tuesday": 1,
-                "wednesday": 2,
-                "thursday": 3,
-                "friday": 4,
-                "saturday": 5,
-                "sunday": 6,
-                "\u043f\u043e\u043d\u0435\u0434\u0435\u043b\u044c\u043d\u0438\u043a": 0,
-                "\u0432\u0442\u043e\u0440\u043d\u0438\u043a": 1,
-                "\u0441\u0440\u0435\u0434\u0430": 2,
-                "\u0441\u0440\u0435\u0434\u0443": 2,
-                "\u0447\u0435\u0442\u0432\u0435\u0440\u0433": 3,
-                "\u043f\u044f\u0442\u043d\u0438\u0446\u0430": 4,
-                "\u043f\u044f\u0442\u043d\u0438\u0446\u0443": 4,
-                "\u0441\u0443\u0431\u0431\u043e\u0442\u0430": 5,
-                "\u0441\u0443\u0431\u0431\u043e\u0442\u0443": 5,
-                "\u0432\u043e\u0441\u043a\u0440\u0435\u0441\u0435\u043d\u044c\u0435": 6,
-            }
-            if normalized in weekdays:
-                data["weekday"] = weekdays[normalized]
+            mapped = _WEEKDAY_MAP.get(value.strip().lower())
+            if mapped is not None:
+                data["weekday"] = mapped
         return data
 
 
@@ -132,45 +136,68 @@ AssistantCommand = Annotated[
 assistant_command_adapter = TypeAdapter(AssistantCommand)
 
 
+_DEFAULT_TIME = time(hour=8, minute=0)
+_ONE_HOUR = timedelta(hours=1)
+# timedelta is immutable, so one shared instance per day offset covers
+# tomorrow, day-after-tomorrow and any next-weekday jump (1..7 days).
+_DAY_DELTAS = tuple(timedelta(days=offset) for offset in range(8))
+
+
 def next_weekday(base_dt: datetime, weekday: int) -> datetime:
     days_ahead = (weekday - base_dt.weekday()) % 7
     if days_ahead == 0:
         days_ahead = 7
-    return base_dt + timedelta(days=days_ahead)
+    return base_dt + _DAY_DELTAS[days_ahead]
 
 
 def resolve_default_run_at(reminder: ReminderInput, now: datetime) -> datetime:
+    return _resolve_run_at(reminder, now, today=now.date(), tz=now.tzinfo or timezone.utc)
+
+
+def resolve_default_run_at_batch(reminders: list[ReminderInput], now: datetime) -> list[datetime]:
+    """Resolve a whole command's reminders against one shared ``now``.
+
+    Computes the date and timezone context once instead of per reminder,
+    which matters for commands carrying up to 30 entries.
+    """
+    today = now.date()
+    tz = now.tzinfo or timezone.utc
+    return [_resolve_run_at(reminder, now, today=today, tz=tz) for reminder in reminders]
+
+
+def _resolve_run_at(reminder: ReminderInput, now: datetime, *, today: date, tz) -> datetime:
     if reminder.day_reference is not None:
         if reminder.day_reference == DayReference.today:
             if reminder.explicit_time_provided and reminder.time_value:
                 parsed_today = _parse_time_text(reminder.time_value)
                 if parsed_today is not None:
-                    return datetime.combine(now.date(), parsed_today, tzinfo=now.tzinfo or timezone.utc)
+                    return datetime.combine(today, parsed_today, tzinfo=tz)
             rounded = now.replace(minute=0, second=0, microsecond=0)
             if now > rounded:
-                rounded += timedelta(hours=1)
+                rounded += _ONE_HOUR
             return rounded
 
         if reminder.day_reference == DayReference.tomorrow:
-            day_date = (now + timedelta(days=1)).date()
+            day_date = today + _DAY_DELTAS[1]
         elif reminder.day_reference == DayReference.day_after_tomorrow:
-            day_date = (now + timedelta(days=2)).date()
+            day_date = today + _DAY_DELTAS[2]
         elif reminder.day_reference == DayReference.weekday:
-            day_date = next_weekday(now, reminder.weekday or 0).date()
+            days_ahead = ((reminder.weekday or 0) - today.weekday()) % 7
+            day_date = today + _DAY_DELTAS[days_ahead or 7]
         elif reminder.day_reference == DayReference.specific_date:
-            day_date = reminder.date_value or now.date()
+            day_date = reminder.date_value or today
         else:
             raise ValueError("Unsupported day_reference")
 
-        default_time = time(hour=8, minute=0)
+        default_time = _DEFAULT_TIME
         if reminder.explicit_time_provided:
             parsed = _parse_time_text(reminder.time_value or "")
             if parsed is not None:
                 default_time = parsed
-        return datetime.combine(day_date, default_time, tzinfo=now.tzinfo or timezone.utc)
+        return datetime.combine(day_date, default_time, tzinfo=tz)
 
     if reminder.run_at is not None:
-        return reminder.run_at if reminder.run_at.tzinfo else reminder.run_at.replace(tzinfo=now.tzinfo or timezone.utc)
+        return reminder.run_at if reminder.run_at.tzinfo else reminder.run_at.replace(tzinfo=tz)
 
     raise ValueError("Either run_at or day_reference must be provided")
 
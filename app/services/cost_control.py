@@ -2,12 +2,16 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 
 
-@dataclass
+@dataclass(slots=True)
 class UsageSnapshot:
-    month_key: str
+    month: int  # year * 100 + month, e.g. 202603
     total_tokens: int
     total_usd: float
 
+    @property
+    def month_key(self) -> str:
+        return f"{self.month // 100:04d}-{self.month % 100:02d}"
+
 
 class MonthlyCostGuard:
     def __init__(
@@ -19,17 +23,43 @@ class MonthlyCostGuard:
         self.monthly_usd_limit = monthly_usd_limit
         self.estimated_input_cost_per_1k = estimated_input_cost_per_1k
         self.estimated_output_cost_per_1k = estimated_output_cost_per_1k
-        self._usage: dict[str, UsageSnapshot] = {}
-        self._alerted_thresholds: dict[str, set[int]] = {}
+        # Per-token rates precomputed once; register_tokens runs on every
+        # LLM response.
+        self._cost_per_input_token = estimated_input_cost_per_1k * 1e-3
+        self._cost_per_output_token = estimated_output_cost_per_1k * 1e-3
+        # Only one month is ever live per process; keeping the current
+        # snapshot directly (rolled over on month change) avoids a dict
+        # lookup on every register_tokens/can_spend call.
+        self._snapshot: UsageSnapshot | None = None
+        self._alerted_thresholds: set[int] = set()
+        # Refreshed on every register_tokens; callers far below the limit
+        # can consult this instead of re-running the full budget check.
+        # A non-positive limit counts as fully used from the start.
+        self._last_used_ratio = 0.0 if monthly_usd_limit > 0 else 1.0
 
-    def _month_key(self, now: datetime | None = None) -> str:
+    def _month_key(self, now: datetime | None = None) -> int:
         now = now or datetime.now(timezone.utc)
-        return f"{now.year:04d}-{now.month:02d}"
+        return now.year * 100 + now.month
 
-    def can_spend(self, estimated_usd: float, now: datetime | None = None) -> bool:
+    def get_or_create_snapshot(self, now: datetime | None = None) -> UsageSnapshot:
         key = self._month_key(now)
-        snapshot = self._usage.get(key, UsageSnapshot(key, 0, 0.0))
-        return snapshot.total_usd + estimated_usd <= self.monthly_usd_limit
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.month != key:
+            snapshot = self._snapshot = UsageSnapshot(key, 0, 0.0)
+            self._alerted_thresholds.clear()
+            self._last_used_ratio = 0.0 if self.monthly_usd_limit > 0 else 1.0
+        return snapshot
+
+    def _spent_usd(self, now: datetime | None) -> float:
+        # No snapshot (or a stale one from last month) means zero spend;
+        # avoid allocating a throwaway snapshot just to read it.
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.month != self._month_key(now):
+            return 0.0
+        return snapshot.total_usd
+
+    def can_spend(self, estimated_usd: float, now: datetime | None = None) -> bool:
+        return self._spent_usd(now) + estimated_usd <= self.monthly_usd_limit
 
     def register_tokens(
         self,
@@ -37,21 +67,31 @@ class MonthlyCostGuard:
         output_tokens: int,
         now: datetime | None = None,
     ) -> UsageSnapshot:
-        key = self._month_key(now)
-        snapshot = self._usage.get(key, UsageSnapshot(key, 0, 0.0))
-        usd = (input_tokens / 1000.0) * self.estimated_input_cost_per_1k
-        usd += (output_tokens / 1000.0) * self.estimated_output_cost_per_1k
+        # Must stay synchronous: with no await inside, the read-modify-write
+        # below is atomic on the event loop and needs no asyncio.Lock.
+        snapshot = self.get_or_create_snapshot(now)
+        usd = input_tokens * self._cost_per_input_token + output_tokens * self._cost_per_output_token
         snapshot.total_tokens += input_tokens + output_tokens
         snapshot.total_usd += usd
-        self._usage[key] = snapshot
+        self._last_used_ratio = (
+            snapshot.total_usd / self.monthly_usd_limit if self.monthly_usd_limit > 0 else 1.0
+        )
         return snapshot
 
+    def last_used_ratio(self) -> float:
+        """Budget utilization as of the last registered spend.
+
+        Within a month spend only grows, so a low cached ratio can never
+        hide an exceeded budget; a stale-high ratio after month rollover
+        merely sends the caller through the full check once.
+        """
+        return self._last_used_ratio
+
     def get_new_alert_thresholds(self, now: datetime | None = None) -> list[int]:
-        key = self._month_key(now)
-        snapshot = self._usage.get(key, UsageSnapshot(key, 0, 0.0))
-        used_pct = (snapshot.total_usd / self.monthly_usd_limit * 100.0) if self.monthly_usd_limit > 0 else 100.0
+        spent = self._spent_usd(now)
+        used_pct = (spent / self.monthly_usd_limit * 100.0) if self.monthly_usd_limit > 0 else 100.0
         thresholds = [50, 80, 100]
-        alerted = self._alerted_thresholds.setdefault(key, set())
+        alerted = self._alerted_thresholds
         newly_crossed = [t for t in thresholds if used_pct >= t and t not in alerted]
         alerted.update(newly_crossed)
         return newly_crossed
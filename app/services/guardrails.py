@@ -1,27 +1,43 @@
-from collections import deque
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
 
 class ChatRateLimiter:
+    # Upper bound on tracked chats; oldest-touched chats are evicted first.
+    MAX_CHATS = 10000
+
     def __init__(self, max_requests: int = 5, window_seconds: int = 60) -> None:
         self._max_requests = max_requests
-        self._window = timedelta(seconds=window_seconds)
-        self._events: dict[int, deque[datetime]] = {}
+        self._window_seconds = float(window_seconds)
+        # Fixed-window counter per chat: (bucket, count).  O(1) per call
+        # with no timestamp queue to scan or expire.
+        self._counts: OrderedDict[int, tuple[int, int]] = OrderedDict()
 
     def allow(self, chat_id: int, now: datetime | None = None) -> bool:
-        now = now or datetime.now(timezone.utc)
-        queue = self._events.setdefault(chat_id, deque())
-        threshold = now - self._window
-        while queue and queue[0] < threshold:
-            queue.popleft()
-        if len(queue) >= self._max_requests:
+        # Plain float timestamps: numeric compares beat tz-aware datetime
+        # comparison and avoid an allocation per message.
+        now_s = time.monotonic() if now is None else now.timestamp()
+        bucket = int(now_s // self._window_seconds)
+        entry = self._counts.get(chat_id)
+        if entry is None:
+            self._counts[chat_id] = (bucket, 1)
+            if len(self._counts) > self.MAX_CHATS:
+                self._counts.popitem(last=False)
+            return True
+        self._counts.move_to_end(chat_id)
+        entry_bucket, count = entry
+        if entry_bucket != bucket:
+            self._counts[chat_id] = (bucket, 1)
+            return True
+        if count >= self._max_requests:
             return False
-        queue.append(now)
+        self._counts[chat_id] = (bucket, count + 1)
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitState:
     failures: int = 0
     opened_until: datetime | None = None
@@ -1,20 +1,29 @@
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
+import random
 import re
-from asyncio import sleep
+from asyncio import Future, get_running_loop, sleep
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timezone
 from typing import Any, Literal
 from zoneinfo import ZoneInfo
 
 import httpx
+import orjson
 from openai import APIConnectionError, APITimeoutError, AsyncOpenAI, RateLimitError
 from pydantic import ValidationError
 
 from app.core.settings import get_settings
 from app.llm.prompts import SEMANTIC_DRAFT_PROMPT_RU
-from app.schemas.commands import AssistantCommand, assistant_command_adapter
+from app.schemas.commands import (
+    AssistantCommand,
+    CommandName,
+    ListRemindersCommand,
+    assistant_command_adapter,
+)
 from app.schemas.semantic_draft import SemanticCommandDraft, semantic_command_draft_adapter
 from app.services.cost_control import MonthlyCostGuard
 from app.services.guardrails import LLMCircuitBreaker
@@ -40,6 +49,55 @@ class LLMCircuitOpenError(ValueError):
 
 logger = logging.getLogger(__name__)
 
+# Stable instruction lines come first and the per-message parts last, so
+# the provider's automatic prefix cache covers the system prompt plus the
+# leading lines and only the datetime/request tail costs fresh tokens.
+_USER_PROMPT_TEMPLATE = (
+    "Interpret user times in the local timezone: {tz}.\n"
+    "Return exactly one valid JSON object matching the schema. "
+    "No markdown, no comments, no extra text.\n"
+    "Current local datetime: {ts}\n"
+    "User request: {text}"
+)
+
+# Bump whenever the system prompt or parsing pipeline changes meaning, so
+# stale cached commands are never replayed against new prompt semantics.
+_PROMPT_VERSION = "v1"
+
+# Phrasings anchored to the current time of day ("через 20 минут",
+# "сейчас") resolve differently minute to minute; caching them for a
+# whole day would replay a stale command. Day-relative words are fine:
+# the cache key already includes the local date.
+_TIME_RELATIVE_RE = re.compile(r"через|сейчас|\bnow\b", re.IGNORECASE)
+
+_JSON_FENCE_RE = re.compile(r"^```(?:json)?\s*(.*?)\s*```$", re.DOTALL | re.IGNORECASE)
+
+_RETRY_BASE_SECONDS = 0.5
+_RETRY_MAX_SECONDS = 16.0
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff: uniform in [0, base * 2^attempt].
+
+    The randomization keeps simultaneous retries from re-colliding
+    against the provider (thundering herd).
+    """
+    return random.uniform(0.0, min(_RETRY_MAX_SECONDS, _RETRY_BASE_SECONDS * (2**attempt)))
+
+
+def _retry_after_seconds(exc: RateLimitError) -> float | None:
+    response = getattr(exc, "response", None)
+    if response is None:
+        return None
+    header = response.headers.get("retry-after")
+    if header is None:
+        return None
+    try:
+        value = float(header)
+    except ValueError:
+        return None
+    return min(value, _RETRY_MAX_SECONDS) if value >= 0 else None
+
 
 class LLMService:
     def __init__(
@@ -72,6 +130,18 @@ class LLMService:
             open_seconds=settings.llm_circuit_open_seconds,
         )
         self._temporal_normalizer = TemporalNormalizer(timezone=settings.app_timezone)
+        # Per-message hot path: keep the timezone object and its name on the
+        # instance instead of rebuilding ZoneInfo from settings per call.
+        self._tz_name = settings.app_timezone
+        self._tz = ZoneInfo(settings.app_timezone)
+        # Requests run at temperature=0, so (model, prompt version, text,
+        # timezone, local date) fully determines the answer; repeats skip
+        # the API call and its token cost entirely.
+        self._response_cache: OrderedDict[str, AssistantCommand] = OrderedDict()
+        self._response_cache_max = 256
+        # Concurrent calls for the same cache key share one API request:
+        # the first caller becomes the leader, the rest await its future.
+        self._inflight: dict[str, Future[AssistantCommand]] = {}
         self._semantic_compiler = SemanticDraftCompiler()
         self._known_model_prices_per_1m: dict[str, tuple[float, float]] = {
             # input, output USD per 1M tokens (static reference catalog)
@@ -191,12 +261,50 @@ class LLMService:
             return None
 
     async def build_command(self, user_text: str, now: datetime | None = None) -> AssistantCommand:
-        settings = get_settings()
-        local_tz = ZoneInfo(settings.app_timezone)
-        now = now or datetime.now(local_tz)
+        now = now or datetime.now(self._tz)
+        local_command = _try_local_parse(user_text)
+        if local_command is not None:
+            return local_command
+
+        cache_key = self._response_cache_key(user_text=user_text, now=now, tz=self._tz_name)
+        if cache_key is None:
+            return await self._build_command_uncached(user_text=user_text, now=now)
+
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            self._response_cache.move_to_end(cache_key)
+            return cached
+
+        pending = self._inflight.get(cache_key)
+        if pending is not None:
+            return await pending
+
+        future: Future[AssistantCommand] = get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            command = await self._build_command_uncached(user_text=user_text, now=now)
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an unawaited future does not log a warning.
+            future.exception()
+            raise
+        else:
+            future.set_result(command)
+            self._response_cache[cache_key] = command
+            if len(self._response_cache) > self._response_cache_max:
+                self._response_cache.popitem(last=False)
+            return command
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    async def _build_command_uncached(self, *, user_text: str, now: datetime) -> AssistantCommand:
         if self._circuit_breaker.is_open(now):
             raise LLMCircuitOpenError("LLM circuit breaker is open")
-        if not self._cost_guard.can_spend(estimated_usd=0.001, now=now):
+        # Fast path: while utilization is clearly low, skip the full
+        # month-key budget check on every message.
+        if self._cost_guard.last_used_ratio() >= 0.5 and not self._cost_guard.can_spend(
+            estimated_usd=0.001, now=now
+        ):
             raise LLMBudgetExceededError("Monthly LLM budget exceeded")
 
         raw_output = await self._request_primary_command(user_text=user_text, now=now)
@@ -216,22 +324,36 @@ class LLMService:
             logger.warning("Semantic draft compilation failed: %s", exc)
             raise LLMCommandValidationError("LLM semantic draft failed compilation") from exc
 
-        command = self._temporal_normalizer.normalize_command(command=command, user_text=user_text, now=now)
-
         # Fast path: skip extra refinement/normalization LLM round-trips.
         # This keeps latency predictable by relying on the primary parsed command.
 
-        return command
+        return self._temporal_normalizer.normalize_command(command=command, user_text=user_text, now=now)
+
+    def _response_cache_key(self, *, user_text: str, now: datetime, tz: str) -> str | None:
+        """Deterministic cache key, or None when the phrasing must not be cached."""
+        normalized = user_text.strip().lower()
+        if _TIME_RELATIVE_RE.search(normalized):
+            return None
+        key_material = orjson.dumps(
+            {
+                "m": self._model,
+                "p": _PROMPT_VERSION,
+                "t": normalized,
+                "tz": tz,
+                "d": now.date().isoformat(),
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(key_material).hexdigest()
 
     async def _request_primary_command(self, *, user_text: str, now: datetime) -> str:
-        settings = get_settings()
-        user_prompt = (
-            f"User request: {user_text}\n"
-            f"Current local datetime ({settings.app_timezone}): {now.isoformat()}\n"
-            "Return exactly one valid JSON object matching the schema. "
-            "No markdown, no comments, no extra text."
+        # timespec="seconds" drops microseconds from the prompt — fewer input
+        # tokens per call with no semantic loss.
+        user_prompt = _USER_PROMPT_TEMPLATE.format(
+            text=user_text,
+            tz=self._tz_name,
+            ts=now.isoformat(timespec="seconds"),
         )
-        response = None
         for attempt in range(self._llm_max_attempts):
             try:
                 response = await self._request_text(
@@ -240,31 +362,39 @@ class LLMService:
                         {"role": "user", "content": user_prompt},
                     ],
                 )
-                break
             except RateLimitError as exc:
-                self._circuit_breaker.register_failure(now)
-                raise LLMRateLimitError(f"{self._provider} rate limit or quota exceeded") from exc
+                # A 429 is usually transient; only count it against the
+                # circuit breaker once retries are exhausted.
+                if attempt >= self._llm_max_attempts - 1:
+                    self._circuit_breaker.register_failure(now)
+                    raise LLMRateLimitError(f"{self._provider} rate limit or quota exceeded") from exc
+                retry_after = _retry_after_seconds(exc)
+                if retry_after is not None:
+                    await sleep(retry_after)
+                await sleep(_backoff_delay(attempt))
             except (APIConnectionError, APITimeoutError):
                 if attempt >= self._llm_max_attempts - 1:
                     self._circuit_breaker.register_failure(now)
                     raise
-                await sleep(0.5 * (attempt + 1))
-
-        assert response is not None
-        self._circuit_breaker.register_success()
-        raw_output, input_tokens, output_tokens = response
-        snapshot = self._cost_guard.register_tokens(input_tokens, output_tokens, now=now)
-        logger.info(
-            "LLM usage tracked: month=%s total_tokens=%s total_usd=%.6f",
-            snapshot.month_key,
-            snapshot.total_tokens,
-            snapshot.total_usd,
-        )
-        for threshold in self._cost_guard.get_new_alert_thresholds(now):
-            logger.warning("LLM budget threshold reached: %s%%", threshold)
+                await sleep(_backoff_delay(attempt))
+            else:
+                self._circuit_breaker.register_success()
+                raw_output, input_tokens, output_tokens = response
+                snapshot = self._cost_guard.register_tokens(input_tokens, output_tokens, now=now)
+                logger.info(
+                    "LLM usage tracked: month=%s total_tokens=%s total_usd=%.6f",
+                    snapshot.month_key,
+                    snapshot.total_tokens,
+                    snapshot.total_usd,
+                )
+                for threshold in self._cost_guard.get_new_alert_thresholds(now):
+                    logger.warning("LLM budget threshold reached: %s%%", threshold)
 
-        logger.info("LLM raw output: %s", raw_output)
-        return raw_output
+                logger.info("LLM raw output: %s", raw_output)
+                return raw_output
+
+        # Unreachable: every failure branch raises on the final attempt.
+        raise RuntimeError("LLM retry loop exhausted without raising")
 
     async def _request_text(self, *, messages: list[dict[str, str]]) -> tuple[str, int, int]:
         if self._provider == "deepseek":
@@ -297,15 +427,16 @@ class LLMService:
         raw_output: str,
         now: datetime,
     ) -> AssistantCommand | None:
-        settings = get_settings()
         prompt = (
             "Fix invalid assistant output into a strict SemanticCommandDraft JSON. "
             "Allowed intent values: create_reminders, list_reminders, delete_reminders. "
             "Return only JSON, no markdown and no explanations."
         )
+        # Same ordering as the primary prompt: variable content last so the
+        # stable prefix stays cacheable.
         user_prompt = (
+            f"Current local datetime ({self._tz_name}): {now.isoformat()}\n"
             f"User request: {user_text}\n"
-            f"Current local datetime ({settings.app_timezone}): {now.isoformat()}\n"
             f"Invalid model output to fix: {raw_output}"
         )
         try:
@@ -337,20 +468,57 @@ class LLMService:
 
 
 
-def parse_assistant_command(raw_output: str | dict[str, Any]) -> AssistantCommand:
+@lru_cache(maxsize=512)
+def _validate_command_cached(canonical_json: bytes) -> AssistantCommand:
+    return assistant_command_adapter.validate_json(canonical_json)
+
+
+# Canonical phrasings that map 1:1 to a command; matching here skips the
+# OpenAI round trip, token accounting and circuit breaker entirely.
+_LOCAL_LIST_ALL_RE = re.compile(
+    r"^/?(?:list|список|все напоминания|показать все напоминания|покажи все напоминания|"
+    r"покажи напоминания|показать напоминания|какие напоминания)\s*\??$",
+    re.IGNORECASE,
+)
+_LOCAL_LIST_TODAY_RE = re.compile(
+    r"^/?(?:today|напоминания на сегодня|показать напоминания на сегодня|"
+    r"покажи напоминания на сегодня|что сегодня)\s*\??$",
+    re.IGNORECASE,
+)
+
+
+def _try_local_parse(user_text: str) -> AssistantCommand | None:
+    text = user_text.strip().lower()
+    if _LOCAL_LIST_ALL_RE.match(text):
+        return ListRemindersCommand(command=CommandName.list_items, mode="all")
+    if _LOCAL_LIST_TODAY_RE.match(text):
+        return ListRemindersCommand(command=CommandName.list_items, mode="today")
+    return None
+
+
+def parse_assistant_command(raw_output: str | bytes | dict[str, Any]) -> AssistantCommand:
     payload: dict[str, Any]
-    if isinstance(raw_output, str):
+    if isinstance(raw_output, (str, bytes)):
         cleaned = _normalize_llm_json_text(raw_output)
+        # Commands are always JSON objects; plain prose (a common model
+        # failure mode that triggers the recovery retry) is rejected on
+        # the first character instead of through the parser's exception.
+        if cleaned[:1] not in ("{", b"{"):
+            raise LLMCommandValidationError("LLM output is not valid JSON")
         try:
-            payload = json.loads(cleaned)
-        except json.JSONDecodeError as exc:
+            payload = orjson.loads(cleaned)
+        except orjson.JSONDecodeError as exc:
             raise LLMCommandValidationError("LLM output is not valid JSON") from exc
     else:
         payload = raw_output
     payload = _normalize_legacy_command_payload(payload)
 
+    # Identical payload shapes repeat within a chat session; canonicalizing
+    # to sorted-key JSON bytes lets repeat validations hit the LRU, and
+    # pydantic-core parses+validates those bytes in a single pass.
+    canonical = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)
     try:
-        return assistant_command_adapter.validate_python(payload)
+        return _validate_command_cached(canonical)
     except ValidationError as exc:
         logger.warning("LLM schema validation failed. payload=%s errors=%s", payload, exc.errors())
         raise LLMCommandValidationError("LLM command does not match schema") from exc
@@ -361,8 +529,8 @@ def parse_semantic_command_draft(raw_output: str | dict[str, Any]) -> SemanticCo
     if isinstance(raw_output, str):
         cleaned = _normalize_llm_json_text(raw_output)
         try:
-            payload = json.loads(cleaned)
-        except json.JSONDecodeError as exc:
+            payload = orjson.loads(cleaned)
+        except orjson.JSONDecodeError as exc:
             raise LLMCommandValidationError("LLM output is not valid JSON") from exc
     else:
         payload = raw_output
@@ -373,9 +541,16 @@ def parse_semantic_command_draft(raw_output: str | dict[str, Any]) -> SemanticCo
         raise LLMCommandValidationError("LLM semantic draft does not match schema") from exc
 
 
-def _normalize_llm_json_text(text: str) -> str:
+def _normalize_llm_json_text(text: str | bytes) -> str | bytes:
+    if isinstance(text, bytes):
+        # orjson parses bytes natively, so unfenced bytes skip the decode;
+        # only fenced output needs the str-based cleanup below.
+        stripped = text.strip()
+        if not stripped.startswith(b"```"):
+            return stripped
+        text = stripped.decode()
     value = text.strip()
-    fenced = re.match(r"^```(?:json)?\s*(.*?)\s*```$", value, flags=re.DOTALL | re.IGNORECASE)
+    fenced = _JSON_FENCE_RE.match(value)
     if fenced:
         value = fenced.group(1).strip()
     return value
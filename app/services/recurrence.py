@@ -1,8 +1,16 @@
 from __future__ import annotations
 
 from calendar import monthrange
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+
+# How far ahead a recurring series is materialized into reminder rows at
+# creation time; series_materializer tops up the window as it slides.
+# 31 days covers every default UNTIL except the monthly end-of-year one,
+# so only long series (monthly, explicit far UNTIL) are deferred.
+EXPANSION_HORIZON = timedelta(days=31)
 
 
 @dataclass(slots=True)
@@ -17,25 +25,50 @@ class RecurrenceRule:
 def parse_recurrence_rule(recurrence_rule: str | None, *, reference: datetime) -> RecurrenceRule | None:
     if not recurrence_rule:
         return None
-    parts: dict[str, str] = {}
+    parsed = _parse_rule_cached(recurrence_rule)
+    if parsed is None or parsed.until is None or parsed.until.tzinfo is not None:
+        return parsed
+    # A naive UNTIL takes the caller's timezone; return a copy so the
+    # cached instance stays reference-independent.
+    return replace(parsed, until=parsed.until.replace(tzinfo=reference.tzinfo or timezone.utc))
+
+
+@lru_cache(maxsize=1024)
+def _parse_rule_cached(recurrence_rule: str) -> RecurrenceRule | None:
+    """Parse a rule string once; recurring reminders replay the same rule
+    on every fire, so the tokenizing work is worth memoizing."""
+    # Single pass, no intermediate dict: only the keys are uppercased and
+    # each value is touched by exactly the branch that needs it.
+    freq = ""
+    interval = 1
+    until_raw: str | None = None
+    byday_raw: str | None = None
+    bymonthday_raw: str | None = None
     for token in recurrence_rule.split(";"):
-        if "=" not in token:
+        key, _, value = token.partition("=")
+        if not value:
             continue
-        key, value = token.split("=", 1)
-        parts[key.strip().upper()] = value.strip()
+        key = key.strip().upper()
+        if key == "FREQ":
+            freq = value.strip().upper()
+        elif key == "INTERVAL":
+            try:
+                interval = max(1, int(value))
+            except ValueError:
+                interval = 1
+        elif key == "UNTIL":
+            until_raw = value.strip()
+        elif key == "BYDAY":
+            byday_raw = value
+        elif key == "BYMONTHDAY":
+            bymonthday_raw = value
 
-    freq = (parts.get("FREQ") or "").upper()
     if freq not in {"MINUTELY", "HOURLY", "DAILY", "WEEKLY", "MONTHLY"}:
         return None
 
-    try:
-        interval = max(1, int(parts.get("INTERVAL", "1")))
-    except ValueError:
-        interval = 1
-
-    until = _parse_until(parts.get("UNTIL"), reference=reference)
-    byday = _parse_byday(parts.get("BYDAY"))
-    bymonthday = _parse_bymonthday(parts.get("BYMONTHDAY"))
+    until = _parse_until(until_raw)
+    byday = _parse_byday(byday_raw)
+    bymonthday = _parse_bymonthday(bymonthday_raw)
     return RecurrenceRule(freq=freq, interval=interval, until=until, byday=byday, bymonthday=bymonthday)
 
 
@@ -60,7 +93,12 @@ def compute_next_run_at(current_run_at: datetime, recurrence_rule: str | None) -
     return candidate
 
 
-def expand_occurrences(start_run_at: datetime, recurrence_rule: str | None) -> list[datetime]:
+def expand_occurrences(
+    start_run_at: datetime,
+    recurrence_rule: str | None,
+    *,
+    horizon: timedelta | None = None,
+) -> list[datetime]:
     parsed = parse_recurrence_rule(recurrence_rule, reference=start_run_at)
     if parsed is None:
         return [start_run_at]
@@ -68,42 +106,29 @@ def expand_occurrences(start_run_at: datetime, recurrence_rule: str | None) -> l
     if parsed.until is None:
         return [start_run_at]
 
+    if horizon is not None and parsed.until > start_run_at + horizon:
+        # Materialize only the near window; rows past it would sit cold in
+        # the table (and its indexes) until the top-up job needs them.
+        parsed = replace(parsed, until=start_run_at + horizon)
+
     if parsed.freq == "MINUTELY":
-        return _expand_minutely(start_run_at, parsed)
+        return _expand_fixed_step(start_run_at, parsed.until, timedelta(minutes=parsed.interval))
     if parsed.freq == "HOURLY":
-        return _expand_hourly(start_run_at, parsed)
+        return _expand_fixed_step(start_run_at, parsed.until, timedelta(hours=parsed.interval))
     if parsed.freq == "DAILY":
-        return _expand_daily(start_run_at, parsed)
+        return _expand_fixed_step(start_run_at, parsed.until, timedelta(days=parsed.interval))
     if parsed.freq == "WEEKLY":
         return _expand_weekly(start_run_at, parsed)
     return _expand_monthly(start_run_at, parsed)
 
 
-def _expand_minutely(start_run_at: datetime, parsed: RecurrenceRule) -> list[datetime]:
-    current = start_run_at
-    items: list[datetime] = []
-    while current <= (parsed.until or start_run_at):
-        items.append(current)
-        current = current + timedelta(minutes=parsed.interval)
-    return items
-
-
-def _expand_hourly(start_run_at: datetime, parsed: RecurrenceRule) -> list[datetime]:
-    current = start_run_at
-    items: list[datetime] = []
-    while current <= (parsed.until or start_run_at):
-        items.append(current)
-        current = current + timedelta(hours=parsed.interval)
-    return items
-
-
-def _expand_daily(start_run_at: datetime, parsed: RecurrenceRule) -> list[datetime]:
-    current = start_run_at
-    items: list[datetime] = []
-    while current <= (parsed.until or start_run_at):
-        items.append(current)
-        current = current + timedelta(days=parsed.interval)
-    return items
+def _expand_fixed_step(start_run_at: datetime, until: datetime, step: timedelta) -> list[datetime]:
+    # Occurrence count is known up front for a fixed step; one multiply
+    # per slot beats accumulating timedelta additions in a loop.
+    count = (until - start_run_at) // step + 1
+    if count <= 0:
+        return []
+    return [start_run_at + step * i for i in range(count)]
 
 
 def _expand_weekly(start_run_at: datetime, parsed: RecurrenceRule) -> list[datetime]:
@@ -160,7 +185,9 @@ def _add_months(base_dt: datetime, months: int) -> datetime:
     return base_dt.replace(year=y, month=m, day=d)
 
 
-def _parse_until(until_raw: str | None, *, reference: datetime) -> datetime | None:
+def _parse_until(until_raw: str | None) -> datetime | None:
+    """May return a naive datetime; parse_recurrence_rule resolves the
+    timezone against the caller's reference."""
     if not until_raw:
         return None
     raw = until_raw.strip()
@@ -172,12 +199,9 @@ def _parse_until(until_raw: str | None, *, reference: datetime) -> datetime | No
             except ValueError:
                 continue
     try:
-        parsed = datetime.fromisoformat(raw)
+        return datetime.fromisoformat(raw)
     except ValueError:
         return None
-    if parsed.tzinfo is None:
-        return parsed.replace(tzinfo=reference.tzinfo or timezone.utc)
-    return parsed
 
 
 def _parse_byday(raw: str | None) -> tuple[int, ...]:
@@ -6,12 +6,18 @@ from datetime import datetime, timedelta
 
 from app.schemas.internal_policies import RecurrenceEndIntent
 
+_INTERVAL_RE = re.compile(r"кажды(?:й|е|ую)\s+(\d+)\s*(минут|час|часа|часов|дн|недел|месяц)")
+_CLOCK_TIME_RE = re.compile(r"\d{1,2}:\d{2}")
+_DOTTED_DATE_RE = re.compile(r"\d{1,2}[./]\d{1,2}([./]\d{2,4})?")
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_COUNT_RE = re.compile(r"(\d+)")
+
 
 def extract_interval_from_text(text: str | None) -> int | None:
     if not text:
         return None
     lower = text.lower()
-    match = re.search(r"кажды(?:й|е|ую)\s+(\d+)\s*(минут|час|часа|часов|дн|недел|месяц)", lower)
+    match = _INTERVAL_RE.search(lower)
     if not match:
         return None
     try:
@@ -33,10 +39,13 @@ def detect_end_intent(until_expression: str | None) -> RecurrenceEndIntent | Non
         return RecurrenceEndIntent.until_duration_from_start
     if any(token in lower for token in ("следующей недели", "пока не", "на время")):
         return RecurrenceEndIntent.ambiguous
-    if re.search(r"\d{1,2}:\d{2}", lower):
-        return RecurrenceEndIntent.until_datetime
-    if re.search(r"\d{1,2}[./]\d{1,2}([./]\d{2,4})?", lower) or re.search(r"\d{4}-\d{2}-\d{2}", lower):
-        return RecurrenceEndIntent.until_date
+    # The time/date shapes all contain digits; a digit-free expression can
+    # skip the regex checks and fall through to the date default directly.
+    if any(ch.isdigit() for ch in lower):
+        if _CLOCK_TIME_RE.search(lower):
+            return RecurrenceEndIntent.until_datetime
+        if _DOTTED_DATE_RE.search(lower) or _ISO_DATE_RE.search(lower):
+            return RecurrenceEndIntent.until_date
     return RecurrenceEndIntent.until_date
 
 
@@ -117,7 +126,7 @@ def _compute_until_from_hint(*, start_local: datetime, end_hint: str, end_expr:
         return start_local.replace(day=last_day, second=59, microsecond=0)
 
     if end_hint == RecurrenceEndIntent.until_duration_from_start.value:
-        count_match = re.search(r"(\d+)", end_expr)
+        count_match = _COUNT_RE.search(end_expr)
         count = int(count_match.group(1)) if count_match else 1
         if "дн" in end_expr:
             return (start_local + timedelta(days=count)).replace(second=59, microsecond=0)
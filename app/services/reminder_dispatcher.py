@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import suppress
+from functools import lru_cache
 from datetime import datetime, timezone
 from typing import Protocol
 
+import asyncpg
 from aiogram import Bot
 
 from app.core.internal_reminders import (
@@ -12,7 +17,7 @@ from app.core.internal_reminders import (
     unwrap_internal_text,
 )
 from app.core.settings import get_settings
-from app.db.session import SessionLocal
+from app.db.session import BackgroundSession
 from app.repositories.reminder_repository import ReminderRepository
 from app.services.recurrence import compute_next_run_at
 from app.services.display_policy import pre_reminder_delta, should_schedule_pre_reminder
@@ -20,13 +25,38 @@ from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
+# Telegram allows ~30 messages/s overall; 25 concurrent sends keeps a
+# full batch well inside that while overlapping the network round trips.
+_SEND_CONCURRENCY = 25
+
+
+# Recurring reminders fire with the same text day after day; memoizing the
+# unwrap and the rendered message skips the repeated prefix parsing.
+@lru_cache(maxsize=4096)
+def _unwrap_cached(text: str) -> str:
+    return unwrap_internal_text(text)
+
+
+@lru_cache(maxsize=4096)
+def _reminder_message(text: str) -> str:
+    return "Напоминание: " + _unwrap_cached(text)
+
+
+class DueReminder(Protocol):
+    id: int
+    chat_id: int
+    text: str
+    run_at: datetime
+    recurrence_rule: str | None
+    series_id: str | None
+
 
 class DueReminderRepository(Protocol):
-    async def list_due_pending(self, until_dt: datetime, limit: int = 100): ...
+    def iter_due_pending(self, until_dt: datetime, chunk: int = 100) -> AsyncIterator[DueReminder]: ...
 
     async def mark_done(self, reminder_ids: list[int]) -> int: ...
 
-    async def reschedule(self, reminder_id: int, next_run_at: datetime) -> int: ...
+    async def reschedule_many(self, updates: list[tuple[int, datetime]]) -> int: ...
 
     async def create_one(
         self,
@@ -48,44 +78,106 @@ async def dispatch_due_with_repository(
     now = now or datetime.now(timezone.utc)
     settings = get_settings()
     now_local = now.astimezone(ZoneInfo(settings.app_timezone))
-    due_items = await repository.list_due_pending(until_dt=now, limit=batch_size)
+
+    # Sends are pure network I/O and run concurrently under a semaphore;
+    # the follow-up bookkeeping stays sequential because the repository
+    # session must not be used from concurrent coroutines.
+    send_semaphore = asyncio.Semaphore(_SEND_CONCURRENCY)
+
+    async def _send_one(item: DueReminder) -> bool:
+        async with send_semaphore:
+            try:
+                await bot.send_message(chat_id=item.chat_id, text=_reminder_message(item.text))
+                return True
+            except Exception:
+                logger.exception("Failed to send reminder id=%s chat_id=%s", item.id, item.chat_id)
+                return False
+
+    # Pipeline: rows stream in through a server-side cursor while earlier
+    # ones are already being sent, so the first reminder fires before a
+    # large backlog finishes fetching.
+    due_items: list[DueReminder] = []
+    send_tasks: list[asyncio.Task[bool]] = []
+    async for item in repository.iter_due_pending(until_dt=now, chunk=batch_size):
+        due_items.append(item)
+        send_tasks.append(asyncio.create_task(_send_one(item)))
     if not due_items:
         return 0
 
+    send_results = await asyncio.gather(*send_tasks)
+
     sent_once_ids: list[int] = []
-    rescheduled_count = 0
-    for item in due_items:
+    reschedules: list[tuple[int, datetime]] = []
+    for item, sent in zip(due_items, send_results):
+        if not sent:
+            continue
         try:
-            is_pre_reminder = is_internal_pre_reminder(item.text)
-            await bot.send_message(chat_id=item.chat_id, text=f"Напоминание: {unwrap_internal_text(item.text)}")
-            next_run_at = compute_next_run_at(item.run_at, getattr(item, "recurrence_rule", None))
+            next_run_at = compute_next_run_at(item.run_at, item.recurrence_rule)
             if next_run_at is None:
                 sent_once_ids.append(item.id)
             else:
-                await repository.reschedule(item.id, next_run_at)
-                if not is_pre_reminder and should_schedule_pre_reminder(
+                reschedules.append((item.id, next_run_at))
+                if not is_internal_pre_reminder(item.text) and should_schedule_pre_reminder(
                     run_at_utc=next_run_at,
                     now_local=now_local,
                     policy=None,
                 ):
                     await repository.create_one(
                         chat_id=item.chat_id,
-                        text=build_pre_reminder_text(unwrap_internal_text(item.text)),
+                        text=build_pre_reminder_text(_unwrap_cached(item.text)),
                         run_at=next_run_at - pre_reminder_delta(None),
                         recurrence_rule=None,
-                        series_id=getattr(item, "series_id", None),
+                        series_id=item.series_id,
                     )
-                rescheduled_count += 1
         except Exception:
-            logger.exception("Failed to send reminder id=%s chat_id=%s", item.id, item.chat_id)
+            logger.exception("Failed to reschedule reminder id=%s chat_id=%s", item.id, item.chat_id)
 
+    if reschedules:
+        await repository.reschedule_many(reschedules)
     if sent_once_ids:
         await repository.mark_done(sent_once_ids)
-    return len(sent_once_ids) + rescheduled_count
+    return len(sent_once_ids) + len(reschedules)
+
+
+def _plain_postgres_dsn(database_url: str) -> str:
+    for prefix in ("postgresql+asyncpg://", "postgresql+psycopg://"):
+        if database_url.startswith(prefix):
+            return "postgresql://" + database_url[len(prefix):]
+    return database_url
+
+
+async def listen_for_due_reminders(bot: Bot, batch_size: int = 100) -> None:
+    """Dispatch immediately on Postgres NOTIFY instead of waiting for the poll.
+
+    A trigger on the reminders table emits ``reminders_due`` whenever a row
+    becomes due soon; the coarse APScheduler poll remains as a safety net.
+    """
+    dsn = _plain_postgres_dsn(get_settings().database_url)
+    while True:
+        try:
+            conn = await asyncpg.connect(dsn)
+            try:
+                wakeups: asyncio.Queue[None] = asyncio.Queue(maxsize=1)
+
+                def _on_notify(*_args) -> None:
+                    with suppress(asyncio.QueueFull):
+                        wakeups.put_nowait(None)
+
+                await conn.add_listener("reminders_due", _on_notify)
+                while True:
+                    await wakeups.get()
+                    await dispatch_due_reminders(bot=bot, batch_size=batch_size)
+            finally:
+                await conn.close()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Due-reminder listener failed; reconnecting in 5s")
+            await asyncio.sleep(5)
 
 
 async def dispatch_due_reminders(bot: Bot, now: datetime | None = None, batch_size: int = 100) -> int:
-    async with SessionLocal() as session:
+    async with BackgroundSession() as session:
         repository = ReminderRepository(session)
         sent_count = await dispatch_due_with_repository(
             repository=repository,
@@ -93,6 +185,7 @@ async def dispatch_due_reminders(bot: Bot, now: datetime | None = None, batch_si
             now=now,
             batch_size=batch_size,
         )
+        await session.commit()
         if sent_count:
             logger.info("Due reminders dispatched: count=%s", sent_count)
         return sent_count
@@ -1,26 +1,59 @@
+import os
 from dataclasses import dataclass
 from datetime import datetime, time, timedelta, timezone
-from uuid import uuid4
+from functools import lru_cache
+from uuid import UUID
 from zoneinfo import ZoneInfo
 
-from app.core.internal_reminders import (
-    build_pre_reminder_text,
-    is_internal_pre_reminder,
-    unwrap_internal_text,
-)
-from app.core.settings import get_settings
+from app.core.internal_reminders import build_pre_reminder_text
 from app.models.reminder import ReminderStatus
+from app.core.settings import get_settings
 from app.repositories.reminder_repository import ReminderRepository
 from app.schemas.commands import (
     CreateRemindersCommand,
     DeleteRemindersCommand,
     ListRemindersCommand,
-    resolve_default_run_at,
+    resolve_default_run_at_batch,
 )
 from app.services.display_policy import pre_reminder_delta, should_schedule_pre_reminder
-from app.services.recurrence import expand_occurrences
+from app.services.recurrence import EXPANSION_HORIZON, expand_occurrences
 from app.services.recurring_end_policy import ensure_until_for_rrule
 
+_ONE_DAY = timedelta(days=1)
+
+
+class _UuidPool:
+    """Slices v4 UUIDs out of one bulk os.urandom read.
+
+    uuid4() pays a kernel crossing per id; here 256 series ids share a
+    single read.
+    """
+
+    __slots__ = ("_buf",)
+    _REFILL = 256 * 16
+
+    def __init__(self) -> None:
+        self._buf = b""
+
+    def get(self) -> UUID:
+        if not self._buf:
+            self._buf = os.urandom(self._REFILL)
+        chunk, self._buf = self._buf[:16], self._buf[16:]
+        raw = bytearray(chunk)
+        raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+        raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+        return UUID(bytes=bytes(raw))
+
+
+_UUID_POOL = _UuidPool()
+
+
+@lru_cache(maxsize=1)
+def _local_tz() -> ZoneInfo:
+    # Settings are immutable after startup; building the ZoneInfo once
+    # avoids the settings + tzdata lookup on every command.
+    return ZoneInfo(get_settings().app_timezone)
+
 
 @dataclass(slots=True)
 class CreatedReminderResult:
@@ -52,6 +85,7 @@ class SelectionFilter:
     by_text_contains: str | None = None
     by_due_from: datetime | None = None
     by_due_to: datetime | None = None
+    by_due_to_exclusive: bool = False
     include_deleted: bool = False
 
 
@@ -65,32 +99,40 @@ class ReminderService:
         command: CreateRemindersCommand,
         now: datetime | None = None,
     ) -> list[CreatedReminderResult]:
-        settings = get_settings()
-        local_tz = ZoneInfo(settings.app_timezone)
+        local_tz = _local_tz()
         now = now or datetime.now(local_tz)
         payload = []
-        for reminder in command.reminders:
-            run_at = resolve_default_run_at(reminder, now)
+        # Indices of user-visible rows, recorded at append time so the
+        # result needs no per-row prefix inspection afterwards.
+        visible_indices: list[int] = []
+        run_ats = resolve_default_run_at_batch(command.reminders, now)
+        for reminder, run_at in zip(command.reminders, run_ats):
             run_at_local = run_at.replace(tzinfo=local_tz) if run_at.tzinfo is None else run_at
-            series_id: str | None = None
+            series_id: UUID | None = None
             recurrence_rule = reminder.recurrence_rule
             if reminder.recurrence_rule:
                 recurrence_rule, _ = ensure_until_for_rrule(
                     recurrence_rule=reminder.recurrence_rule,
                     start_local=run_at_local,
                 )
-                series_id = str(uuid4())
+                series_id = _UUID_POOL.get()
                 await self._repository.create_series(
                     series_id=series_id,
                     chat_id=chat_id,
                     source_text=reminder.text,
                     recurrence_rule=recurrence_rule,
                 )
-            run_slots = expand_occurrences(run_at_local, recurrence_rule)
+            run_slots = expand_occurrences(run_at_local, recurrence_rule, horizon=EXPANSION_HORIZON)
             for slot_local in run_slots:
                 if recurrence_rule and slot_local < now:
                     continue
-                slot_utc = slot_local.astimezone(timezone.utc)
+                # Identity check skips an allocation in the common case of
+                # LLM-supplied ISO8601 UTC timestamps.
+                slot_utc = (
+                    slot_local
+                    if slot_local.tzinfo is timezone.utc
+                    else slot_local.astimezone(timezone.utc)
+                )
                 if _should_schedule_pre_reminder_for_rule(
                     run_at_utc=slot_utc,
                     now_local=now,
@@ -106,6 +148,7 @@ class ReminderService:
                         }
                     )
 
+                visible_indices.append(len(payload))
                 payload.append(
                     {
                         "chat_id": chat_id,
@@ -116,16 +159,17 @@ class ReminderService:
                     }
                 )
 
-        created = await self._repository.create_many(payload)
+        created = await self._repository.create_many_ids(payload)
+        # The payload rows already carry text and rule; only generated ids
+        # (and canonical run_at) come back from the insert.
         return [
             CreatedReminderResult(
-                id=item.id,
-                text=unwrap_internal_text(item.text),
-                run_at=item.run_at,
-                recurrence_rule=item.recurrence_rule,
+                id=created[i][0],
+                text=payload[i]["text"],
+                run_at=created[i][1],
+                recurrence_rule=payload[i]["recurrence_rule"],
             )
-            for item in created
-            if not is_internal_pre_reminder(item.text)
+            for i in visible_indices
         ]
 
     async def list_from_command(
@@ -134,17 +178,26 @@ class ReminderService:
         command: ListRemindersCommand,
         now: datetime | None = None,
     ) -> list[ReminderListItem]:
-        settings = get_settings()
-        local_tz = ZoneInfo(settings.app_timezone)
-        now = now or datetime.now(local_tz)
-        selection = self._selection_from_list_command(command=command, now=now)
-        records = await self._select_items(chat_id=chat_id, selection=selection)
+        now = now or datetime.now(_local_tz())
+        if (
+            command.mode == "all"
+            and command.status is None
+            and command.search_text is None
+            and command.from_dt is None
+            and command.to_dt is None
+        ):
+            # Unfiltered "show all" dominates list traffic; skip building
+            # the selection object and rely on the repository defaults.
+            records = await self._repository.list_items(chat_id=chat_id)
+        else:
+            selection = self._selection_from_list_command(command=command, now=now)
+            records = await self._select_items(chat_id=chat_id, selection=selection)
         return [
             ReminderListItem(
                 id=item.id,
                 text=item.text,
                 run_at=item.run_at,
-                status=item.status.value if isinstance(item.status, ReminderStatus) else str(item.status),
+                status=item.status_value,
                 recurrence_rule=item.recurrence_rule,
             )
             for item in records
@@ -167,31 +220,28 @@ class ReminderService:
         ):
             return DeletedReminderResult(deleted_count=0, items=[])
 
-        selection = SelectionFilter(
-            by_id=command.reminder_id,
-            by_status=command.status,
-            by_text_contains=command.search_text,
-            by_due_from=command.from_dt,
-            by_due_to=command.to_dt,
-        )
-        selected = await self._select_items(
-            chat_id=chat_id,
-            selection=selection,
+        # One UPDATE .. RETURNING both selects and soft-deletes the rows,
+        # so every returned item is already in the deleted status.
+        deleted_rows = await self._repository.delete_returning(
+            chat_id,
+            reminder_id=command.reminder_id,
+            status=command.status,
+            search_text=command.search_text,
+            from_dt=command.from_dt,
+            to_dt=command.to_dt,
             last_n=command.last_n if command.mode == "last_n" else None,
         )
-
-        selected_items = [
+        deleted_items = [
             ReminderListItem(
-                id=item.id,
-                text=item.text,
-                run_at=item.run_at,
-                status=item.status.value if isinstance(item.status, ReminderStatus) else str(item.status),
-                recurrence_rule=item.recurrence_rule,
+                id=row.id,
+                text=row.text,
+                run_at=row.run_at,
+                status=ReminderStatus.deleted.value,
+                recurrence_rule=row.recurrence_rule,
             )
-            for item in selected
+            for row in deleted_rows
         ]
-        deleted_count = await self._repository.delete_by_ids([item.id for item in selected_items])
-        return DeletedReminderResult(deleted_count=deleted_count, items=selected_items)
+        return DeletedReminderResult(deleted_count=len(deleted_items), items=deleted_items)
 
     async def _select_items(
         self,
@@ -210,6 +260,7 @@ class ReminderService:
                 from_dt=selection.by_due_from,
                 to_dt=selection.by_due_to,
                 include_deleted=selection.include_deleted,
+                to_dt_exclusive=selection.by_due_to_exclusive,
             )
         return await self._repository.list_items(
             chat_id=chat_id,
@@ -219,6 +270,7 @@ class ReminderService:
             from_dt=selection.by_due_from,
             to_dt=selection.by_due_to,
             include_deleted=selection.include_deleted,
+            to_dt_exclusive=selection.by_due_to_exclusive,
         )
 
     def _selection_from_list_command(self, *, command: ListRemindersCommand, now: datetime) -> SelectionFilter:
@@ -229,10 +281,12 @@ class ReminderService:
             by_due_to=command.to_dt,
         )
         if command.mode == "today":
+            # Half-open [midnight, next midnight) bound: one addition, no
+            # microsecond trimming, and no edge case at day end.
             day_start = datetime.combine(now.date(), time.min, tzinfo=now.tzinfo or timezone.utc)
-            day_end = day_start + timedelta(days=1) - timedelta(microseconds=1)
             selection.by_due_from = day_start
-            selection.by_due_to = day_end
+            selection.by_due_to = day_start + _ONE_DAY
+            selection.by_due_to_exclusive = True
         if command.status == "deleted":
             selection.include_deleted = True
         return selection
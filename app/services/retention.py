@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+
+from app.db.session import BackgroundSession
+from app.repositories.reminder_repository import ReminderRepository
+
+logger = logging.getLogger(__name__)
+
+# Finished reminders stay queryable this long for listing history, then
+# leave the table so due/list scans keep a bounded working set.
+FINISHED_RETENTION = timedelta(days=90)
+
+
+async def purge_finished_reminders(
+    now: datetime | None = None,
+    retention: timedelta = FINISHED_RETENTION,
+) -> int:
+    """Drop done/deleted rows past retention in one bulk DELETE."""
+    now = now or datetime.now(timezone.utc)
+    async with BackgroundSession() as session:
+        repository = ReminderRepository(session)
+        purged = await repository.purge_finished_before(now - retention)
+        await session.commit()
+        if purged:
+            logger.info("Retention purge removed %s finished reminders", purged)
+        return purged
@@ -31,6 +31,51 @@ class PeriodWindow:
     until: datetime
 
 
+# Compiled once at import: these run for every parsed draft, and inline
+# re.search calls would pay the pattern-cache lookup on each message.
+_PRE_REMINDER_MINUTES_RE = re.compile(r"(\d{1,3})\s*(мин|minute)")
+_MONTH_DAY_RE = re.compile(r"\b([1-9]|[12]\d|3[01])\b")
+_WRAPPER_PREFIX_RES = (
+    re.compile(r"^\s*напомни\s*[:,]?\s+", flags=re.IGNORECASE),
+    re.compile(r"^\s*что\s+", flags=re.IGNORECASE),
+    re.compile(r"^\s*чтобы\s+", flags=re.IGNORECASE),
+)
+_PERIOD_RANGE_RE = re.compile(
+    r"\bс\s+([01]?\d|2[0-3])(?:[:.\-]([0-5]\d))?(?:\s*час(?:а|ов)?)?"
+    r"\s+до\s+([01]?\d|2[0-3])(?:[:.\-]([0-5]\d))?(?:\s*час(?:а|ов)?)?\b"
+)
+_TIME_RE = re.compile(r"\b([01]?\d|2[0-3])(?::([0-5]\d))?\b")
+_ISO_DATE_RE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+_UNTIL_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+_RU_MONTHS = {
+    "января": 1,
+    "январь": 1,
+    "февраля": 2,
+    "февраль": 2,
+    "марта": 3,
+    "март": 3,
+    "апреля": 4,
+    "апрель": 4,
+    "мая": 5,
+    "май": 5,
+    "июня": 6,
+    "июнь": 6,
+    "июля": 7,
+    "июль": 7,
+    "августа": 8,
+    "август": 8,
+    "сентября": 9,
+    "сентябрь": 9,
+    "октября": 10,
+    "октябрь": 10,
+    "ноября": 11,
+    "ноябрь": 11,
+    "декабря": 12,
+    "декабрь": 12,
+}
+_RU_DATE_RE = re.compile(rf"\b([0-3]?\d)\s+({'|'.join(_RU_MONTHS)})(?:\s+(\d{{4}}))?\b")
+
+
 class SemanticDraftCompiler:
     def compile_to_command(self, *, draft: SemanticCommandDraft, now: datetime | None = None) -> AssistantCommand:
         if draft.intent == "create_reminders":
@@ -291,7 +336,7 @@ class SemanticDraftCompiler:
 
         minutes = None
         if raw:
-            m = re.search(r"(\d{1,3})\s*(мин|minute)", raw)
+            m = _PRE_REMINDER_MINUTES_RE.search(raw)
             if m:
                 minutes = int(m.group(1))
             elif "час" in raw or "hour" in raw:
@@ -397,7 +442,7 @@ class SemanticDraftCompiler:
         raw = raw_value.strip()
         if not raw:
             return None
-        m = re.fullmatch(r"(\d{4})-(\d{2})-(\d{2})", raw)
+        m = _UNTIL_DATE_RE.fullmatch(raw)
         if m:
             y, mon, d = int(m.group(1)), int(m.group(2)), int(m.group(3))
             return datetime.combine(date(y, mon, d), time(23, 59, 59))
@@ -437,7 +482,7 @@ class SemanticDraftCompiler:
         return values
 
     def _extract_month_day(self, text: str) -> int | None:
-        m = re.search(r"\b([1-9]|[12]\d|3[01])\b", text)
+        m = _MONTH_DAY_RE.search(text)
         if not m:
             return None
         day = int(m.group(1))
@@ -475,16 +520,11 @@ class SemanticDraftCompiler:
         if not looks_like_command_wrapper:
             return text
 
-        patterns = [
-            re.compile(r"^\s*напомни\s*[:,]?\s+", flags=re.IGNORECASE),
-            re.compile(r"^\s*что\s+", flags=re.IGNORECASE),
-            re.compile(r"^\s*чтобы\s+", flags=re.IGNORECASE),
-        ]
         normalized = text
         changed = True
         while changed:
             changed = False
-            for pattern in patterns:
+            for pattern in _WRAPPER_PREFIX_RES:
                 updated = pattern.sub("", normalized, count=1).strip()
                 if updated != normalized:
                     normalized = updated
@@ -519,6 +559,12 @@ class SemanticDraftCompiler:
         if not raw:
             return None
 
+        # A window needs either an explicit time range (always has digits)
+        # or a whole-day phrase (always contains "дн"); membership checks
+        # are far cheaper than the scans below.
+        if "дн" not in raw and not any(ch.isdigit() for ch in raw):
+            return None
+
         period_date = self._period_date_from_text(raw, base_date=base_date)
         explicit_range = self._extract_period_time_range(raw)
         if explicit_range is not None:
@@ -553,10 +599,7 @@ class SemanticDraftCompiler:
         return parsed_date or base_date
 
     def _extract_period_time_range(self, text: str) -> tuple[time, time] | None:
-        match = re.search(
-            r"\bс\s+([01]?\d|2[0-3])(?:[:.\-]([0-5]\d))?(?:\s*час(?:а|ов)?)?\s+до\s+([01]?\d|2[0-3])(?:[:.\-]([0-5]\d))?(?:\s*час(?:а|ов)?)?\b",
-            text,
-        )
+        match = _PERIOD_RANGE_RE.search(text)
         if not match:
             return None
         start = time(int(match.group(1)), int(match.group(2) or "00"))
@@ -571,7 +614,7 @@ class SemanticDraftCompiler:
             return "10:00"
         if "девять" in raw:
             return "09:00"
-        m = re.search(r"\b([01]?\d|2[0-3])(?::([0-5]\d))?\b", raw)
+        m = _TIME_RE.search(raw)
         if not m:
             return None
         hours = int(m.group(1))
@@ -587,46 +630,24 @@ class SemanticDraftCompiler:
         if "сегодня" in raw or "сегодняш" in raw:
             return base_date
 
-        iso = re.search(r"\b(\d{4})-(\d{2})-(\d{2})\b", raw)
+        # Both date shapes below require a digit; skip the regex work when
+        # the expression has none.
+        if not any(ch.isdigit() for ch in raw):
+            return None
+
+        iso = _ISO_DATE_RE.search(raw)
         if iso:
             try:
                 return date(int(iso.group(1)), int(iso.group(2)), int(iso.group(3)))
             except ValueError:
                 return None
 
-        months = {
-            "января": 1,
-            "январь": 1,
-            "февраля": 2,
-            "февраль": 2,
-            "марта": 3,
-            "март": 3,
-            "апреля": 4,
-            "апрель": 4,
-            "мая": 5,
-            "май": 5,
-            "июня": 6,
-            "июнь": 6,
-            "июля": 7,
-            "июль": 7,
-            "августа": 8,
-            "август": 8,
-            "сентября": 9,
-            "сентябрь": 9,
-            "октября": 10,
-            "октябрь": 10,
-            "ноября": 11,
-            "ноябрь": 11,
-            "декабря": 12,
-            "декабрь": 12,
-        }
-        month_pattern = "|".join(months)
-        russian = re.search(rf"\b([0-3]?\d)\s+({month_pattern})(?:\s+(\d{{4}}))?\b", raw)
+        russian = _RU_DATE_RE.search(raw)
         if not russian:
             return None
 
         day = int(russian.group(1))
-        month = months[russian.group(2)]
+        month = _RU_MONTHS[russian.group(2)]
         year = int(russian.group(3)) if russian.group(3) else base_date.year
         try:
             parsed = date(year, month, day)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+
+from app.core.internal_reminders import build_pre_reminder_text
+from app.db.session import BackgroundSession
+from app.repositories.reminder_repository import ReminderRepository
+from app.services.display_policy import pre_reminder_delta, should_schedule_pre_reminder
+from app.services.recurrence import EXPANSION_HORIZON, expand_occurrences, parse_recurrence_rule
+from app.services.reminder_service import _local_tz
+
+logger = logging.getLogger(__name__)
+
+
+async def materialize_series_occurrences(
+    now: datetime | None = None,
+    horizon: timedelta = EXPANSION_HORIZON,
+) -> int:
+    """Extend recurring series whose materialized window has shrunk.
+
+    Creation only expands ``EXPANSION_HORIZON`` ahead; as time passes the
+    remaining window shortens, so this periodic job finds each series'
+    newest occurrence and inserts the slots that now fall inside the
+    window, until the rule's UNTIL is exhausted.
+    """
+    now = now or datetime.now(timezone.utc)
+    horizon_end = now + horizon
+    local_tz = _local_tz()
+    now_local = now.astimezone(local_tz)
+
+    async with BackgroundSession() as session:
+        repository = ReminderRepository(session)
+        frontiers = await repository.list_series_frontiers(horizon_end=horizon_end)
+        if not frontiers:
+            return 0
+
+        payload: list[dict] = []
+        for row in frontiers:
+            remaining = horizon_end - row.last_run_at
+            if remaining <= timedelta(0):
+                continue
+            # Expand in the app timezone, exactly as the creation path
+            # does: BYDAY/BYMONTHDAY key off local weekday and month-day,
+            # so expanding from the stored UTC instant would drift series
+            # whose local fire time crosses UTC midnight.
+            last_run_local = row.last_run_at.astimezone(local_tz)
+            parsed = parse_recurrence_rule(row.recurrence_rule, reference=last_run_local)
+            if parsed is None or (parsed.until is not None and parsed.until <= last_run_local):
+                # Exhausted series: UNTIL never moves, so no future run
+                # can appear past the frontier.
+                continue
+            slots = expand_occurrences(last_run_local, row.recurrence_rule, horizon=remaining)
+            upper = row.recurrence_rule.upper()
+            wants_pre = "FREQ=HOURLY" not in upper and "FREQ=MINUTELY" not in upper
+            for slot in slots:
+                if slot <= last_run_local:
+                    continue
+                slot_utc = slot.astimezone(timezone.utc)
+                if wants_pre and should_schedule_pre_reminder(
+                    run_at_utc=slot_utc,
+                    now_local=now_local,
+                    policy=None,
+                ):
+                    payload.append(
+                        {
+                            "chat_id": row.chat_id,
+                            "text": build_pre_reminder_text(row.source_text),
+                            "run_at": slot_utc - pre_reminder_delta(None),
+                            "recurrence_rule": None,
+                            "series_id": row.series_id,
+                        }
+                    )
+                payload.append(
+                    {
+                        "chat_id": row.chat_id,
+                        "text": row.source_text,
+                        "run_at": slot_utc,
+                        "recurrence_rule": None,
+                        "series_id": row.series_id,
+                    }
+                )
+
+        if not payload:
+            return 0
+        await repository.create_many_ids(payload)
+        await session.commit()
+        logger.info("Series top-up materialized %s occurrences", len(payload))
+        return len(payload)
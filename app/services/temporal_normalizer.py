@@ -3,6 +3,7 @@
 import re
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from app.schemas.commands import AssistantCommand, CommandName, DayReference, ReminderInput
@@ -26,6 +27,10 @@ _RU_MONTHS = {
     "\u0434\u0435\u043a\u0430\u0431\u0440\u044f": 12,
 }
 
+# One alternation over all month names instead of a per-month re.search
+# loop for every normalized reminder.
+_RU_DATE_PATTERN = re.compile(rf"\b([0-3]?\d)\s+({'|'.join(_RU_MONTHS)})\b")
+
 _RU_WEEKDAYS = {
     "\u043f\u043e\u043d\u0435\u0434\u0435\u043b\u044c\u043d\u0438\u043a": 0,
     "\u0432\u0442\u043e\u0440\u043d\u0438\u043a": 1,
@@ -61,10 +66,7 @@ class TemporalNormalizer:
 
     def _normalize_reminder(self, *, item: ReminderInput, user_text: str, now: datetime) -> ReminderInput:
         text = user_text.lower()
-        inferred_day_reference = _infer_day_reference(text)
-        inferred_weekday = _infer_weekday(text)
-        inferred_date = _infer_date_value(text, now.date())
-        inferred_time = _infer_time_text(text)
+        inferred_day_reference, inferred_weekday, inferred_date, inferred_time = _infer_all(text, now.date())
 
         update: dict[str, object] = {}
         day_reference = item.day_reference
@@ -104,6 +106,22 @@ class TemporalNormalizer:
         return item.model_copy(update=update)
 
 
+@lru_cache(maxsize=2048)
+def _infer_all(text: str, base_date: date) -> tuple[DayReference | None, int | None, date | None, str | None]:
+    """All four inferences for one (text, date) pair, computed once.
+
+    The results only depend on the lowered text and the current date, so
+    repeated phrasings — and every reminder within a multi-item command —
+    reuse the same scan. The date in the key retires stale entries daily.
+    """
+    return (
+        _infer_day_reference(text),
+        _infer_weekday(text),
+        _infer_date_value(text, base_date),
+        _infer_time_text(text),
+    )
+
+
 def _infer_day_reference(text: str) -> DayReference | None:
     if "\u043f\u043e\u0441\u043b\u0435\u0437\u0430\u0432\u0442\u0440\u0430" in text:
         return DayReference.day_after_tomorrow
@@ -126,6 +144,10 @@ def _infer_weekday(text: str) -> int | None:
 
 
 def _infer_date_value(text: str, base_date: date) -> date | None:
+    # Every date shape below contains a digit; one C-level scan skips the
+    # regex cascade for the common digit-free message.
+    if not any(ch.isdigit() for ch in text):
+        return None
     iso = _ISO_DATE_PATTERN.search(text)
     if iso:
         try:
@@ -150,10 +172,9 @@ def _infer_date_value(text: str, base_date: date) -> date | None:
 
 
 def _infer_russian_date(text: str) -> tuple[int, int] | None:
-    for month_name, month_idx in _RU_MONTHS.items():
-        m = re.search(rf"\b([0-3]?\d)\s+{month_name}\b", text)
-        if m:
-            return int(m.group(1)), month_idx
+    m = _RU_DATE_PATTERN.search(text)
+    if m:
+        return int(m.group(1)), _RU_MONTHS[m.group(2)]
     return None
 
 
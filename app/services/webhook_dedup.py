@@ -2,21 +2,40 @@ from datetime import datetime, timedelta, timezone
 
 
 class WebhookDeduplicator:
-    def __init__(self, ttl_seconds: int = 600) -> None:
+    """Remembers recently seen update ids with two alternating generation sets.
+
+    Membership and insert are O(1) set operations; no per-entry timestamps are
+    stored. A generation flips when it outlives the TTL or fills up, so an id
+    is remembered for at least ``ttl_seconds`` and at most twice that.
+    """
+
+    def __init__(self, ttl_seconds: int = 600, max_entries: int = 10000) -> None:
         self._ttl = timedelta(seconds=ttl_seconds)
-        self._seen: dict[int, datetime] = {}
+        self._max_entries = max_entries
+        self._active: set[int] = set()
+        self._previous: set[int] = set()
+        self._generation_started_at: datetime | None = None
 
     def mark_seen(self, update_id: int, now: datetime | None = None) -> bool:
         now = now or datetime.now(timezone.utc)
-        self._cleanup(now)
-        if update_id in self._seen:
+        if self._generation_started_at is None:
+            self._generation_started_at = now
+        elapsed = now - self._generation_started_at
+        if elapsed >= self._ttl:
+            if elapsed >= self._ttl + self._ttl:
+                self._previous.clear()
+                self._active.clear()
+            else:
+                self._rotate()
+            self._generation_started_at = now
+        if update_id in self._active or update_id in self._previous:
             return False
-        self._seen[update_id] = now
+        if len(self._active) >= self._max_entries:
+            self._rotate()
+            self._generation_started_at = now
+        self._active.add(update_id)
         return True
 
-    def _cleanup(self, now: datetime) -> None:
-        threshold = now - self._ttl
-        stale = [uid for uid, ts in self._seen.items() if ts < threshold]
-        for uid in stale:
-            self._seen.pop(uid, None)
-
+    def _rotate(self) -> None:
+        self._active, self._previous = self._previous, self._active
+        self._active.clear()
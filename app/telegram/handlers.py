@@ -79,16 +79,21 @@ def _models_keyboard(models: list[str]) -> ReplyKeyboardMarkup:
 
 
 def _format_run_at(dt) -> str:
-    return dt.astimezone(display_tz).strftime("%d.%m.%Y %H:%M")
+    # Direct field formatting beats strftime's format-string interpreter
+    # in the reply render loop.
+    d = dt.astimezone(display_tz)
+    return f"{d.day:02d}.{d.month:02d}.{d.year:04d} {d.hour:02d}:{d.minute:02d}"
+
+
+_STATUS_LABELS = {
+    "pending": t("status_pending"),
+    "done": t("status_done"),
+    "deleted": t("status_deleted"),
+}
 
 
 def _format_status(status: str) -> str:
-    mapping = {
-        "pending": t("status_pending"),
-        "done": t("status_done"),
-        "deleted": t("status_deleted"),
-    }
-    return mapping.get(status, status)
+    return _STATUS_LABELS.get(status, status)
 
 
 async def on_start_message(message: Message) -> None:
@@ -145,11 +150,12 @@ async def _handle_business_text(
                     parsed_command=command.model_dump(mode="json"),
                     result_stats={"created": len(created), "matched": len(created), "changed": len(created)},
                 )
-                lines = [t("created_reminders")]
-                for idx, item in enumerate(created, start=1):
-                    lines.append(f"{idx}. #{item.id} | {_format_run_at(item.run_at)}")
-                    lines.append(f"   {item.text}")
-                await message.answer("\n".join(lines))
+                await session.commit()
+                body = "\n".join(
+                    f"{idx}. #{item.id} | {_format_run_at(item.run_at)}\n   {item.text}"
+                    for idx, item in enumerate(created, start=1)
+                )
+                await message.answer(t("created_reminders") + "\n" + body)
                 return
 
             if command.command == CommandName.list_items:
@@ -166,12 +172,14 @@ async def _handle_business_text(
                     parsed_command=command.model_dump(mode="json"),
                     result_stats={"matched": len(items), "created": 0, "changed": 0},
                 )
-                lines = [t("found_reminders")]
-                for idx, item in enumerate(items, start=1):
-                    rec = f"{t('recurrence_prefix')}{item.recurrence_rule}" if item.recurrence_rule else ""
-                    lines.append(f"{idx}. #{item.id} [{_format_status(item.status)}] | {_format_run_at(item.run_at)}{rec}")
-                    lines.append(f"   {item.text}")
-                await message.answer("\n".join(lines))
+                await session.commit()
+                rec_prefix = t("recurrence_prefix")
+                body = "\n".join(
+                    f"{idx}. #{item.id} [{_format_status(item.status)}] | {_format_run_at(item.run_at)}"
+                    f"{rec_prefix + item.recurrence_rule if item.recurrence_rule else ''}\n   {item.text}"
+                    for idx, item in enumerate(items, start=1)
+                )
+                await message.answer(t("found_reminders") + "\n" + body)
                 return
 
             if command.command == CommandName.delete:
@@ -188,11 +196,12 @@ async def _handle_business_text(
                     parsed_command=command.model_dump(mode="json"),
                     result_stats={"matched": len(deleted.items), "created": 0, "changed": deleted.deleted_count},
                 )
-                lines = [t("deleted_count").format(count=deleted.deleted_count)]
-                for idx, item in enumerate(deleted.items, start=1):
-                    lines.append(f"{idx}. #{item.id} | {_format_run_at(item.run_at)}")
-                    lines.append(f"   {item.text}")
-                await message.answer("\n".join(lines))
+                await session.commit()
+                body = "\n".join(
+                    f"{idx}. #{item.id} | {_format_run_at(item.run_at)}\n   {item.text}"
+                    for idx, item in enumerate(deleted.items, start=1)
+                )
+                await message.answer(t("deleted_count").format(count=deleted.deleted_count) + "\n" + body)
                 return
     except Exception:
         logger.exception("Business command handling failed")
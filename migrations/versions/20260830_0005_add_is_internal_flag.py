@@ -0,0 +1,37 @@
+"""add is_internal flag with user-visible partial index
+
+Revision ID: 20260830_0005
+Revises: 20260223_0004
+Create Date: 2026-08-30
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260830_0005"
+down_revision: str | None = "20260223_0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "reminders",
+        sa.Column("is_internal", sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+    op.execute(
+        "UPDATE reminders SET is_internal = true WHERE text LIKE '\\_\\_pre1h\\_\\_::%'"
+    )
+    op.create_index(
+        "ix_reminders_user_visible",
+        "reminders",
+        ["chat_id", "run_at"],
+        postgresql_where=sa.text("is_internal = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reminders_user_visible", table_name="reminders")
+    op.drop_column("reminders", "is_internal")
@@ -0,0 +1,33 @@
+"""add composite (chat_id, run_at, id) index for list queries
+
+Revision ID: 20260830_0006
+Revises: 20260830_0005
+Create Date: 2026-08-30
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260830_0006"
+down_revision: str | None = "20260830_0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_reminders_chat_runat_id", "reminders", ["chat_id", "run_at", "id"])
+    # Serves the list_last_n DESC + LIMIT path without a sort node.
+    op.create_index(
+        "ix_reminders_chat_runat_id_desc",
+        "reminders",
+        ["chat_id", sa.text("run_at DESC"), sa.text("id DESC")],
+    )
+    op.drop_index("ix_reminders_chat_id", table_name="reminders")
+
+
+def downgrade() -> None:
+    op.create_index("ix_reminders_chat_id", "reminders", ["chat_id"])
+    op.drop_index("ix_reminders_chat_runat_id_desc", table_name="reminders")
+    op.drop_index("ix_reminders_chat_runat_id", table_name="reminders")
@@ -0,0 +1,26 @@
+"""add pg_trgm GIN index for reminder text search
+
+Revision ID: 20260830_0007
+Revises: 20260830_0006
+Create Date: 2026-08-30
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20260830_0007"
+down_revision: str | None = "20260830_0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_reminders_text_trgm ON reminders USING gin (text gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_reminders_text_trgm")
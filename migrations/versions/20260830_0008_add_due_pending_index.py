@@ -0,0 +1,29 @@
+"""add partial index for due pending reminders
+
+Revision ID: 20260830_0008
+Revises: 20260830_0007
+Create Date: 2026-08-30
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260830_0008"
+down_revision: str | None = "20260830_0007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_reminders_due",
+        "reminders",
+        ["run_at", "id"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reminders_due", table_name="reminders")
@@ -0,0 +1,42 @@
+"""notify reminders_due channel when a row becomes due soon
+
+Revision ID: 20260830_0009
+Revises: 20260830_0008
+Create Date: 2026-08-30
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20260830_0009"
+down_revision: str | None = "20260830_0008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_reminders_due() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.status = 'pending' AND NEW.run_at <= now() + interval '15 seconds' THEN
+                PERFORM pg_notify('reminders_due', NEW.id::text);
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER reminders_due_notify
+        AFTER INSERT OR UPDATE OF run_at, status ON reminders
+        FOR EACH ROW EXECUTE FUNCTION notify_reminders_due()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS reminders_due_notify ON reminders")
+    op.execute("DROP FUNCTION IF EXISTS notify_reminders_due()")
@@ -0,0 +1,23 @@
+"""add (chat_id, status, run_at) index for status-filtered listings
+
+Revision ID: 20260830_0010
+Revises: 20260830_0009
+Create Date: 2026-08-30
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20260830_0010"
+down_revision: str | None = "20260830_0009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_reminders_chat_status_runat", "reminders", ["chat_id", "status", "run_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reminders_chat_status_runat", table_name="reminders")
@@ -0,0 +1,35 @@
+"""drop single-column run_at index, add non-deleted partial listing index
+
+Revision ID: 20260830_0011
+Revises: 20260830_0010
+Create Date: 2026-08-30
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20260830_0011"
+down_revision: str | None = "20260830_0010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The chat-prefixed composites and the pending-only partial cover every
+    # run_at access path; the single-column index only added write cost.
+    op.drop_index("ix_reminders_run_at", table_name="reminders")
+    # Default listings exclude deleted rows, which accumulate forever; the
+    # partial index stays small no matter how much history a chat carries.
+    op.create_index(
+        "ix_reminders_chat_pending",
+        "reminders",
+        ["chat_id", "run_at"],
+        postgresql_where=sa.text("status <> 'deleted'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reminders_chat_pending", table_name="reminders")
+    op.create_index("ix_reminders_run_at", "reminders", ["run_at"])
@@ -0,0 +1,28 @@
+"""store series ids as native uuid instead of varchar(36)
+
+Revision ID: 20260830_0012
+Revises: 20260830_0011
+Create Date: 2026-08-30
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20260830_0012"
+down_revision: str | None = "20260830_0011"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # uuid is 16 bytes against 36 for the text form, so ix_reminders_series_id
+    # and the series primary key shrink by more than half; the type change
+    # rebuilds the dependent indexes in place.
+    op.execute("ALTER TABLE reminders ALTER COLUMN series_id TYPE uuid USING series_id::uuid")
+    op.execute("ALTER TABLE reminder_series ALTER COLUMN series_id TYPE uuid USING series_id::uuid")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE reminder_series ALTER COLUMN series_id TYPE varchar(36) USING series_id::text")
+    op.execute("ALTER TABLE reminders ALTER COLUMN series_id TYPE varchar(36) USING series_id::text")
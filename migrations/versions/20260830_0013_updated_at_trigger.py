@@ -0,0 +1,44 @@
+"""maintain updated_at with a database trigger
+
+Revision ID: 20260830_0013
+Revises: 20260830_0012
+Create Date: 2026-08-30
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20260830_0013"
+down_revision: str | None = "20260830_0012"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The trigger stamps every UPDATE server-side, so application
+    # statements no longer carry an updated_at bind at all.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_reminders_updated BEFORE UPDATE ON reminders"
+        " FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+    )
+    op.execute(
+        "CREATE TRIGGER trg_reminder_series_updated BEFORE UPDATE ON reminder_series"
+        " FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_reminder_series_updated ON reminder_series")
+    op.execute("DROP TRIGGER IF EXISTS trg_reminders_updated ON reminders")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
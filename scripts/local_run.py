@@ -15,4 +15,6 @@ if str(ROOT_DIR) not in sys.path:
 
 
 if __name__ == "__main__":
-    uvicorn.run("app.main:app", host="0.0.0.0", port=18010)
+    # uvloop is not available on Windows; uvicorn falls back cleanly elsewhere.
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    uvicorn.run("app.main:app", host="0.0.0.0", port=18010, loop=loop, http="httptools")
@@ -0,0 +1,48 @@
+from dataclasses import dataclass, field
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+
+
+@dataclass(slots=True)
+class _Usage:
+    input_tokens: int = 10
+    output_tokens: int = 10
+
+
+@dataclass(slots=True)
+class _LLMResponse:
+    output_text: str
+    usage: _Usage = field(default_factory=_Usage)
+
+
+class _DummyResponses:
+    def __init__(self, output_texts: list[str]) -> None:
+        self._output_texts = list(output_texts)
+
+    async def create(self, **kwargs) -> _LLMResponse:
+        if not self._output_texts:
+            raise RuntimeError("No more mocked responses")
+        return _LLMResponse(output_text=self._output_texts.pop(0))
+
+
+class DummyLLMClient:
+    """Scripted OpenAI Responses client replaying canned output texts."""
+
+    def __init__(self, output_texts: list[str]) -> None:
+        self.responses = _DummyResponses(output_texts)
+
+
+def make_dummy_client(output_texts: list[str]) -> DummyLLMClient:
+    return DummyLLMClient(output_texts)
+
+
+@pytest.fixture(scope="session")
+def client():
+    # One app + lifespan for the whole session; building the FastAPI app
+    # (route table, pydantic schemas) per test dominates these tests.
+    app = create_app()
+    with TestClient(app) as test_client:
+        yield test_client
@@ -1,41 +1,42 @@
 import pytest
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from app.schemas.commands import DeleteRemindersCommand
 from app.services.reminder_service import ReminderService
 
 
+@dataclass(slots=True)
 class FakeDeleteRecord:
-    def __init__(self, idx: int, status: str, text: str, run_at: datetime):
-        self.id = idx
-        self.status = status
-        self.text = text
-        self.run_at = run_at
-        self.recurrence_rule = None
+    id: int
+    status: str
+    text: str
+    run_at: datetime
+    recurrence_rule: str | None = None
+
+    @property
+    def status_value(self) -> str:
+        return self.status
 
 
 class FakeDeleteRepository:
     def __init__(self) -> None:
-        self.filter_calls = []
-        self.last_n_calls = []
+        self.delete_calls = []
         self.deleted_ids = []
         self.filter_result = []
         self.last_n_result = []
 
-    async def list_items(self, chat_id: int, **kwargs):
-        self.filter_calls.append((chat_id, kwargs))
+    async def delete_returning(self, chat_id: int, **kwargs):
+        self.delete_calls.append((chat_id, kwargs))
+        if kwargs.get("last_n") is not None:
+            rows = self.last_n_result
+        else:
+            rows = self.filter_result
         reminder_id = kwargs.get("reminder_id")
-        if reminder_id is None:
-            return self.filter_result
-        return [item for item in self.filter_result if item.id == reminder_id]
-
-    async def list_last_n(self, chat_id: int, n: int, **kwargs):
-        self.last_n_calls.append((chat_id, n, kwargs))
-        return self.last_n_result
-
-    async def delete_by_ids(self, reminder_ids: list[int]) -> int:
-        self.deleted_ids = list(reminder_ids)
-        return len(reminder_ids)
+        if reminder_id is not None:
+            rows = [item for item in rows if item.id == reminder_id]
+        self.deleted_ids = [item.id for item in rows]
+        return rows
 
 
 def test_delete_schema_requires_last_n_for_last_mode() -> None:
@@ -65,7 +66,7 @@ async def test_delete_by_filter() -> None:
     result = await service.delete_from_command(chat_id=1, command=cmd)
     assert result.deleted_count == 1
     assert repo.deleted_ids == [1]
-    assert repo.filter_calls[0][1]["status"] == "pending"
+    assert repo.delete_calls[0][1]["status"] == "pending"
 
 
 async def test_delete_last_n() -> None:
@@ -81,7 +82,7 @@ async def test_delete_last_n() -> None:
     result = await service.delete_from_command(chat_id=1, command=cmd)
     assert result.deleted_count == 2
     assert repo.deleted_ids == [10, 11]
-    assert repo.last_n_calls[0][1] == 2
+    assert repo.delete_calls[0][1]["last_n"] == 2
 
 
 async def test_delete_all_requires_explicit_confirmation() -> None:
@@ -38,11 +38,14 @@ class _FakeService:
 
 class _FakeSessionCtx:
     async def __aenter__(self):
-        return object()
+        return self
 
     async def __aexit__(self, exc_type, exc, tb):
         return None
 
+    async def commit(self):
+        return None
+
 
 class _FakeLimiter:
     def allow(self, chat_id: int) -> bool:
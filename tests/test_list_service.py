@@ -1,16 +1,23 @@
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
+import pytest
+
 from app.schemas.commands import ListRemindersCommand
-from app.services.reminder_service import ReminderService
+from app.services.reminder_service import ReminderService, SelectionFilter
 
 
+@dataclass(slots=True)
 class FakeListRecord:
-    def __init__(self, idx: int, status: str, text: str, run_at: datetime, recurrence_rule: str | None = None):
-        self.id = idx
-        self.status = status
-        self.text = text
-        self.run_at = run_at
-        self.recurrence_rule = recurrence_rule
+    id: int
+    status: str
+    text: str
+    run_at: datetime
+    recurrence_rule: str | None = None
+
+    @property
+    def status_value(self) -> str:
+        return self.status
 
 
 class FakeListRepository:
@@ -18,54 +25,120 @@ class FakeListRepository:
         self.last_args = {}
         self.result: list[FakeListRecord] = []
 
-    async def list_items(self, chat_id: int, **kwargs):
-        self.last_args = {"chat_id": chat_id, **kwargs}
+    async def list_items(
+        self,
+        chat_id: int,
+        *,
+        reminder_id=None,
+        status=None,
+        search_text=None,
+        from_dt=None,
+        to_dt=None,
+        include_deleted=False,
+        to_dt_exclusive=False,
+    ):
+        self.last_args = {
+            "chat_id": chat_id,
+            "reminder_id": reminder_id,
+            "status": status,
+            "search_text": search_text,
+            "from_dt": from_dt,
+            "to_dt": to_dt,
+            "include_deleted": include_deleted,
+            "to_dt_exclusive": to_dt_exclusive,
+        }
         return self.result
 
-
-async def test_list_all_passes_no_filters() -> None:
-    repo = FakeListRepository()
-    repo.result = [FakeListRecord(1, "pending", "A", datetime(2026, 2, 21, 10, 0, tzinfo=timezone.utc))]
-    service = ReminderService(repo)  # type: ignore[arg-type]
-
-    cmd = ListRemindersCommand.model_validate({"command": "list_reminders", "mode": "all"})
-    data = await service.list_from_command(chat_id=100, command=cmd)
-
-    assert len(data) == 1
-    assert repo.last_args["status"] is None
-    assert repo.last_args["search_text"] is None
+    async def list_last_n(
+        self,
+        chat_id: int,
+        n: int,
+        *,
+        reminder_id=None,
+        status=None,
+        search_text=None,
+        from_dt=None,
+        to_dt=None,
+        include_deleted=False,
+        to_dt_exclusive=False,
+    ):
+        self.last_args = {
+            "chat_id": chat_id,
+            "n": n,
+            "reminder_id": reminder_id,
+            "status": status,
+            "search_text": search_text,
+            "from_dt": from_dt,
+            "to_dt": to_dt,
+            "include_deleted": include_deleted,
+            "to_dt_exclusive": to_dt_exclusive,
+        }
+        return self.result
 
 
-async def test_list_today_sets_day_bounds() -> None:
+@pytest.mark.parametrize(
+    ("payload", "expected_args"),
+    [
+        pytest.param(
+            {"mode": "all"},
+            {"status": None, "search_text": None},
+            id="all-passes-no-filters",
+        ),
+        pytest.param(
+            {"mode": "today"},
+            {
+                "from_dt": datetime(2026, 2, 21, 0, 0, tzinfo=timezone.utc),
+                "to_dt": datetime(2026, 2, 22, 0, 0, tzinfo=timezone.utc),
+                "to_dt_exclusive": True,
+            },
+            id="today-sets-day-bounds",
+        ),
+        pytest.param(
+            {
+                "mode": "range",
+                "status": "pending",
+                "search_text": "клиент",
+                "from_dt": "2026-02-21T00:00:00+00:00",
+                "to_dt": "2026-02-22T00:00:00+00:00",
+            },
+            {
+                "status": "pending",
+                "search_text": "клиент",
+                "from_dt": datetime(2026, 2, 21, 0, 0, tzinfo=timezone.utc),
+                "to_dt": datetime(2026, 2, 22, 0, 0, tzinfo=timezone.utc),
+            },
+            id="status-search-range-forwarded",
+        ),
+    ],
+)
+async def test_list_command_forwards_expected_filters(payload: dict, expected_args: dict) -> None:
     repo = FakeListRepository()
+    repo.result = [FakeListRecord(1, "pending", "A", datetime(2026, 2, 21, 10, 0, tzinfo=timezone.utc))]
     service = ReminderService(repo)  # type: ignore[arg-type]
     now = datetime(2026, 2, 21, 10, 15, tzinfo=timezone.utc)
-    cmd = ListRemindersCommand.model_validate({"command": "list_reminders", "mode": "today"})
+    cmd = ListRemindersCommand.model_validate({"command": "list_reminders", **payload})
 
-    await service.list_from_command(chat_id=200, command=cmd, now=now)
+    data = await service.list_from_command(chat_id=100, command=cmd, now=now)
 
-    assert repo.last_args["from_dt"] == datetime(2026, 2, 21, 0, 0, tzinfo=timezone.utc)
-    assert repo.last_args["to_dt"] == datetime(2026, 2, 21, 23, 59, 59, 999999, tzinfo=timezone.utc)
+    assert len(data) == 1
+    for key, value in expected_args.items():
+        assert repo.last_args[key] == value
 
 
-async def test_list_status_search_range_forwarded() -> None:
+async def test_select_items_last_n_forwards_selection_filters() -> None:
     repo = FakeListRepository()
+    repo.result = [FakeListRecord(1, "pending", "A", datetime(2026, 2, 21, 10, 0, tzinfo=timezone.utc))]
     service = ReminderService(repo)  # type: ignore[arg-type]
-    cmd = ListRemindersCommand.model_validate(
-        {
-            "command": "list_reminders",
-            "mode": "range",
-            "status": "pending",
-            "search_text": "клиент",
-            "from_dt": "2026-02-21T00:00:00+00:00",
-            "to_dt": "2026-02-22T00:00:00+00:00",
-        }
+    selection = SelectionFilter(
+        by_status="pending",
+        by_due_to=datetime(2026, 2, 22, 0, 0, tzinfo=timezone.utc),
+        by_due_to_exclusive=True,
     )
 
-    await service.list_from_command(chat_id=300, command=cmd)
+    items = await service._select_items(chat_id=400, selection=selection, last_n=2)
 
+    assert len(items) == 1
+    assert repo.last_args["n"] == 2
     assert repo.last_args["status"] == "pending"
-    assert repo.last_args["search_text"] == "клиент"
-    assert repo.last_args["from_dt"] == datetime(2026, 2, 21, 0, 0, tzinfo=timezone.utc)
     assert repo.last_args["to_dt"] == datetime(2026, 2, 22, 0, 0, tzinfo=timezone.utc)
-
+    assert repo.last_args["to_dt_exclusive"] is True
@@ -10,7 +10,7 @@ from app.services.reminder_dispatcher import dispatch_due_with_repository
 from app.services.recurrence import compute_next_run_at
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeReminder:
     id: int
     chat_id: int
@@ -29,10 +29,11 @@ class InMemoryRepo:
         self.created_pre: list[FakeReminder] = []
         self._next_id = max((item.id for item in items), default=0) + 1
 
-    async def list_due_pending(self, until_dt: datetime, limit: int = 100):
+    async def iter_due_pending(self, until_dt: datetime, chunk: int = 100):
         due = [item for item in self.items if item.status == "pending" and item.run_at <= until_dt]
         due.sort(key=lambda x: (x.run_at, x.id))
-        return due[:limit]
+        for item in due:
+            yield item
 
     async def mark_done(self, reminder_ids: list[int]) -> int:
         self.done_ids.extend(reminder_ids)
@@ -42,14 +43,17 @@ class InMemoryRepo:
                 item.status = "done"
         return len(reminder_ids)
 
-    async def reschedule(self, reminder_id: int, next_run_at: datetime) -> int:
-        for item in self.items:
-            if item.id == reminder_id:
-                item.run_at = next_run_at
-                item.status = "pending"
-                self.rescheduled.append((reminder_id, next_run_at))
-                return 1
-        return 0
+    async def reschedule_many(self, updates: list[tuple[int, datetime]]) -> int:
+        changed = 0
+        for reminder_id, next_run_at in updates:
+            for item in self.items:
+                if item.id == reminder_id:
+                    item.run_at = next_run_at
+                    item.status = "pending"
+                    self.rescheduled.append((reminder_id, next_run_at))
+                    changed += 1
+                    break
+        return changed
 
     async def create_one(
         self,
@@ -1,17 +1,28 @@
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
+import pytest
+
 from app.core.internal_reminders import INTERNAL_PRE_REMINDER_PREFIX
 from app.schemas.commands import CreateRemindersCommand
 from app.services.reminder_service import ReminderService
 
+UTC = timezone.utc
+
+# Shared scenario instants, built once at import instead of per test.
+NOW_FEB21 = datetime(2026, 2, 21, 10, 15, tzinfo=UTC)
+NOW_FEB22 = datetime(2026, 2, 22, 10, 15, tzinfo=UTC)
+NOW_MAY24_NOON = datetime(2026, 5, 24, 12, 0, tzinfo=UTC)
+FEB23_9 = datetime(2026, 2, 23, 9, 0, tzinfo=UTC)
+
 
+@dataclass(slots=True)
 class FakeReminder:
-    def __init__(self, idx: int, data: dict):
-        self.id = idx
-        self.text = data["text"]
-        self.run_at = data["run_at"]
-        self.recurrence_rule = data.get("recurrence_rule")
-        self.series_id = data.get("series_id")
+    id: int
+    text: str
+    run_at: datetime
+    recurrence_rule: str | None = None
+    series_id: str | None = None
 
 
 class FakeRepository:
@@ -20,8 +31,23 @@ class FakeRepository:
         self.created_series: list[dict] = []
 
     async def create_many(self, items):
-        self.saved_payload = list(items)
-        return [FakeReminder(i + 1, item) for i, item in enumerate(items)]
+        # The service hands over a list it no longer touches; copying it
+        # would just double-iterate the payload.
+        self.saved_payload = items if isinstance(items, list) else list(items)
+        return [
+            FakeReminder(
+                id=i + 1,
+                text=item["text"],
+                run_at=item["run_at"],
+                recurrence_rule=item.get("recurrence_rule"),
+                series_id=item.get("series_id"),
+            )
+            for i, item in enumerate(self.saved_payload)
+        ]
+
+    async def create_many_ids(self, items):
+        self.saved_payload = items if isinstance(items, list) else list(items)
+        return [(i + 1, item["run_at"]) for i, item in enumerate(self.saved_payload)]
 
     async def create_series(self, *, series_id: str, chat_id: int, source_text: str, recurrence_rule: str):
         self.created_series.append(
@@ -35,358 +61,273 @@ class FakeRepository:
         return None
 
 
-async def test_create_multiple_with_default_time_rules() -> None:
-    repo = FakeRepository()
-    service = ReminderService(repo)
-    cmd = CreateRemindersCommand.model_validate(
-        {
-            "command": "create_reminders",
-            "reminders": [
-                {"text": "Сегодня без времени", "day_reference": "today", "explicit_time_provided": False},
-                {"text": "Завтра без времени", "day_reference": "tomorrow", "explicit_time_provided": False},
-            ],
-        }
+@pytest.fixture
+def repo() -> FakeRepository:
+    return FakeRepository()
+
+
+@pytest.fixture
+def service(repo: FakeRepository) -> ReminderService:
+    return ReminderService(repo)  # type: ignore[arg-type]
+
+
+def _create_cmd(*reminders: dict) -> CreateRemindersCommand:
+    return CreateRemindersCommand.model_validate(
+        {"command": "create_reminders", "reminders": list(reminders)}
     )
-    now = datetime(2026, 2, 21, 10, 15, tzinfo=timezone.utc)
-    created = await service.create_from_command(chat_id=123, command=cmd, now=now)
+
+
+async def test_create_multiple_with_default_time_rules(service: ReminderService, repo: FakeRepository) -> None:
+    cmd = _create_cmd(
+        {"text": "Сегодня без времени", "day_reference": "today", "explicit_time_provided": False},
+        {"text": "Завтра без времени", "day_reference": "tomorrow", "explicit_time_provided": False},
+    )
+    created = await service.create_from_command(chat_id=123, command=cmd, now=NOW_FEB21)
 
     assert len(created) == 2
-    assert created[0].run_at == datetime(2026, 2, 21, 11, 0, tzinfo=timezone.utc)
-    assert created[1].run_at == datetime(2026, 2, 22, 8, 0, tzinfo=timezone.utc)
+    assert created[0].run_at == datetime(2026, 2, 21, 11, 0, tzinfo=UTC)
+    assert created[1].run_at == datetime(2026, 2, 22, 8, 0, tzinfo=UTC)
     assert len(repo.saved_payload) == 3
     assert repo.saved_payload[1]["text"].startswith(INTERNAL_PRE_REMINDER_PREFIX)
-    assert repo.saved_payload[1]["run_at"] == datetime(2026, 2, 22, 7, 0, tzinfo=timezone.utc)
+    assert repo.saved_payload[1]["run_at"] == datetime(2026, 2, 22, 7, 0, tzinfo=UTC)
 
 
-async def test_create_with_recurrence_rule() -> None:
-    repo = FakeRepository()
-    service = ReminderService(repo)
-    cmd = CreateRemindersCommand.model_validate(
+async def test_create_with_recurrence_rule(service: ReminderService, repo: FakeRepository) -> None:
+    cmd = _create_cmd(
         {
-            "command": "create_reminders",
-            "reminders": [
-                {
-                    "text": "Ежедневная задача",
-                    "run_at": "2026-02-23T09:00:00+00:00",
-                    "recurrence_rule": "FREQ=DAILY",
-                    "explicit_time_provided": True,
-                }
-            ],
+            "text": "Ежедневная задача",
+            "run_at": "2026-02-23T09:00:00+00:00",
+            "recurrence_rule": "FREQ=DAILY",
+            "explicit_time_provided": True,
         }
     )
-    now = datetime(2026, 2, 22, 10, 15, tzinfo=timezone.utc)
+    now = NOW_FEB22
     created = await service.create_from_command(chat_id=123, command=cmd, now=now)
     assert len(created) == 7
-    assert created[0].run_at == datetime(2026, 2, 23, 9, 0, tzinfo=timezone.utc)
-    assert created[-1].run_at == datetime(2026, 3, 1, 9, 0, tzinfo=timezone.utc)
+    assert created[0].run_at == FEB23_9
+    assert created[-1].run_at == datetime(2026, 3, 1, 9, 0, tzinfo=UTC)
     assert all(item.recurrence_rule is None for item in created)
     assert len(repo.saved_payload) == 14
     assert len(repo.created_series) == 1
     assert repo.created_series[0]["recurrence_rule"] == "FREQ=DAILY;UNTIL=2026-03-01T09:00:59+00:00"
     assert repo.saved_payload[0]["series_id"] is not None
     assert repo.saved_payload[0]["text"].startswith(INTERNAL_PRE_REMINDER_PREFIX)
-    assert repo.saved_payload[0]["run_at"] == datetime(2026, 2, 23, 8, 0, tzinfo=timezone.utc)
+    assert repo.saved_payload[0]["run_at"] == datetime(2026, 2, 23, 8, 0, tzinfo=UTC)
     assert all(item["recurrence_rule"] is None for item in repo.saved_payload)
 
 
-async def test_create_keeps_explicit_recurrence_until() -> None:
-    repo = FakeRepository()
-    service = ReminderService(repo)
-    cmd = CreateRemindersCommand.model_validate(
+async def test_create_keeps_explicit_recurrence_until(service: ReminderService, repo: FakeRepository) -> None:
+    cmd = _create_cmd(
         {
-            "command": "create_reminders",
-            "reminders": [
-                {
-                    "text": "Почасовой контроль",
-                    "run_at": "2026-02-23T09:00:00+00:00",
-                    "recurrence_rule": "FREQ=HOURLY;UNTIL=2026-02-23T15:00:00+00:00",
-                    "explicit_time_provided": True,
-                }
-            ],
+            "text": "Почасовой контроль",
+            "run_at": "2026-02-23T09:00:00+00:00",
+            "recurrence_rule": "FREQ=HOURLY;UNTIL=2026-02-23T15:00:00+00:00",
+            "explicit_time_provided": True,
         }
     )
-    now = datetime(2026, 2, 22, 10, 15, tzinfo=timezone.utc)
+    now = NOW_FEB22
     created = await service.create_from_command(chat_id=123, command=cmd, now=now)
     assert len(created) == 7
-    assert created[0].run_at == datetime(2026, 2, 23, 9, 0, tzinfo=timezone.utc)
-    assert created[-1].run_at == datetime(2026, 2, 23, 15, 0, tzinfo=timezone.utc)
+    assert created[0].run_at == FEB23_9
+    assert created[-1].run_at == datetime(2026, 2, 23, 15, 0, tzinfo=UTC)
     assert len(repo.created_series) == 1
     assert len(repo.saved_payload) == 7
 
 
-async def test_create_hourly_for_whole_day_generates_24_visible_reminders_without_pre_reminders() -> None:
-    repo = FakeRepository()
-    service = ReminderService(repo)
-    cmd = CreateRemindersCommand.model_validate(
+async def test_create_hourly_for_whole_day_generates_24_visible_reminders_without_pre_reminders(
+    service: ReminderService, repo: FakeRepository
+) -> None:
+    cmd = _create_cmd(
         {
-            "command": "create_reminders",
-            "reminders": [
-                {
-                    "text": "Проверить воду",
-                    "date_value": "2026-05-25",
-                    "time": "00:00",
-                    "day_reference": "specific_date",
-                    "recurrence_rule": "FREQ=HOURLY;UNTIL=2026-05-25T23:59:59+00:00",
-                    "explicit_time_provided": True,
-                }
-            ],
+            "text": "Проверить воду",
+            "date_value": "2026-05-25",
+            "time": "00:00",
+            "day_reference": "specific_date",
+            "recurrence_rule": "FREQ=HOURLY;UNTIL=2026-05-25T23:59:59+00:00",
+            "explicit_time_provided": True,
         }
     )
     created = await service.create_from_command(
         chat_id=123,
         command=cmd,
-        now=datetime(2026, 5, 24, 12, 0, tzinfo=timezone.utc),
+        now=NOW_MAY24_NOON,
     )
 
     assert len(created) == 24
     assert len(repo.saved_payload) == 24
-    assert created[0].run_at == datetime(2026, 5, 25, 0, 0, tzinfo=timezone.utc)
-    assert created[-1].run_at == datetime(2026, 5, 25, 23, 0, tzinfo=timezone.utc)
+    assert created[0].run_at == datetime(2026, 5, 25, 0, 0, tzinfo=UTC)
+    assert created[-1].run_at == datetime(2026, 5, 25, 23, 0, tzinfo=UTC)
 
 
-async def test_create_every_two_hours_for_whole_day_generates_12_visible_reminders() -> None:
-    repo = FakeRepository()
-    service = ReminderService(repo)
-    cmd = CreateRemindersCommand.model_validate(
+async def test_create_every_two_hours_for_whole_day_generates_12_visible_reminders(
+    service: ReminderService,
+) -> None:
+    cmd = _create_cmd(
         {
-            "command": "create_reminders",
-            "reminders": [
-                {
-                    "text": "Проверить воду",
-                    "date_value": "2026-05-25",
-                    "time": "00:00",
-                    "day_reference": "specific_date",
-                    "recurrence_rule": "FREQ=HOURLY;INTERVAL=2;UNTIL=2026-05-25T23:59:59+00:00",
-                    "explicit_time_provided": True,
-                }
-            ],
+            "text": "Проверить воду",
+            "date_value": "2026-05-25",
+            "time": "00:00",
+            "day_reference": "specific_date",
+            "recurrence_rule": "FREQ=HOURLY;INTERVAL=2;UNTIL=2026-05-25T23:59:59+00:00",
+            "explicit_time_provided": True,
         }
     )
     created = await service.create_from_command(
         chat_id=123,
         command=cmd,
-        now=datetime(2026, 5, 24, 12, 0, tzinfo=timezone.utc),
+        now=NOW_MAY24_NOON,
     )
 
     assert len(created) == 12
-    assert created[0].run_at == datetime(2026, 5, 25, 0, 0, tzinfo=timezone.utc)
-    assert created[-1].run_at == datetime(2026, 5, 25, 22, 0, tzinfo=timezone.utc)
+    assert created[0].run_at == datetime(2026, 5, 25, 0, 0, tzinfo=UTC)
+    assert created[-1].run_at == datetime(2026, 5, 25, 22, 0, tzinfo=UTC)
 
 
-async def test_create_every_30_minutes_in_time_range_generates_inclusive_schedule() -> None:
-    repo = FakeRepository()
-    service = ReminderService(repo)
-    cmd = CreateRemindersCommand.model_validate(
+async def test_create_today_single_notification_only(service: ReminderService) -> None:
+    cmd = _create_cmd(
         {
-            "command": "create_reminders",
-            "reminders": [
-                {
-                    "text": "Проверить воду",
-                    "date_value": "2026-05-25",
-                    "time": "10:00",
-                    "day_reference": "specific_date",
-                    "recurrence_rule": "FREQ=MINUTELY;INTERVAL=30;UNTIL=2026-05-25T12:00:00+00:00",
-                    "explicit_time_provided": True,
-                }
-            ],
+            "text": "Позвонить сегодня",
+            "run_at": "2026-02-21T16:00:00+00:00",
+            "explicit_time_provided": True,
         }
     )
-    created = await service.create_from_command(
-        chat_id=123,
-        command=cmd,
-        now=datetime(2026, 5, 24, 12, 0, tzinfo=timezone.utc),
-    )
+    created = await service.create_from_command(chat_id=123, command=cmd, now=NOW_FEB21)
 
-    assert [item.run_at for item in created] == [
-        datetime(2026, 5, 25, 10, 0, tzinfo=timezone.utc),
-        datetime(2026, 5, 25, 10, 30, tzinfo=timezone.utc),
-        datetime(2026, 5, 25, 11, 0, tzinfo=timezone.utc),
-        datetime(2026, 5, 25, 11, 30, tzinfo=timezone.utc),
-        datetime(2026, 5, 25, 12, 0, tzinfo=timezone.utc),
-    ]
+    assert len(created) == 1
+    assert created[0].run_at == datetime(2026, 2, 21, 16, 0, tzinfo=UTC)
 
 
-async def test_create_recurring_time_range_skips_past_slots() -> None:
-    repo = FakeRepository()
-    service = ReminderService(repo)
-    cmd = CreateRemindersCommand.model_validate(
-        {
-            "command": "create_reminders",
-            "reminders": [
-                {
-                    "text": "Периодический тест",
-                    "date_value": "2026-05-24",
-                    "time": "16:00",
-                    "day_reference": "specific_date",
-                    "recurrence_rule": "FREQ=MINUTELY;INTERVAL=15;UNTIL=2026-05-24T17:00:00+00:00",
-                    "explicit_time_provided": True,
-                }
+# One scenario table for every "expand a rule into a schedule" case:
+# expected entries are either exact run_at datetimes or, for multi-week
+# spans where only the dates matter, YYYY-MM-DD strings.
+@pytest.mark.parametrize(
+    ("reminder", "now", "expected"),
+    [
+        pytest.param(
+            {
+                "text": "Проверить воду",
+                "date_value": "2026-05-25",
+                "time": "10:00",
+                "day_reference": "specific_date",
+                "recurrence_rule": "FREQ=MINUTELY;INTERVAL=30;UNTIL=2026-05-25T12:00:00+00:00",
+                "explicit_time_provided": True,
+            },
+            NOW_MAY24_NOON,
+            [
+                datetime(2026, 5, 25, 10, 0, tzinfo=UTC),
+                datetime(2026, 5, 25, 10, 30, tzinfo=UTC),
+                datetime(2026, 5, 25, 11, 0, tzinfo=UTC),
+                datetime(2026, 5, 25, 11, 30, tzinfo=UTC),
+                datetime(2026, 5, 25, 12, 0, tzinfo=UTC),
             ],
-        }
-    )
-    created = await service.create_from_command(
-        chat_id=123,
-        command=cmd,
-        now=datetime(2026, 5, 24, 16, 23, tzinfo=timezone.utc),
-    )
-
-    assert [item.run_at for item in created] == [
-        datetime(2026, 5, 24, 16, 30, tzinfo=timezone.utc),
-        datetime(2026, 5, 24, 16, 45, tzinfo=timezone.utc),
-        datetime(2026, 5, 24, 17, 0, tzinfo=timezone.utc),
-    ]
-
-
-async def test_create_today_single_notification_only() -> None:
-    repo = FakeRepository()
-    service = ReminderService(repo)
-    cmd = CreateRemindersCommand.model_validate(
-        {
-            "command": "create_reminders",
-            "reminders": [
-                {
-                    "text": "Позвонить сегодня",
-                    "run_at": "2026-02-21T16:00:00+00:00",
-                    "explicit_time_provided": True,
-                }
+            id="every-30-minutes-inclusive-range",
+        ),
+        pytest.param(
+            {
+                "text": "Периодический тест",
+                "date_value": "2026-05-24",
+                "time": "16:00",
+                "day_reference": "specific_date",
+                "recurrence_rule": "FREQ=MINUTELY;INTERVAL=15;UNTIL=2026-05-24T17:00:00+00:00",
+                "explicit_time_provided": True,
+            },
+            datetime(2026, 5, 24, 16, 23, tzinfo=UTC),
+            [
+                datetime(2026, 5, 24, 16, 30, tzinfo=UTC),
+                datetime(2026, 5, 24, 16, 45, tzinfo=UTC),
+                datetime(2026, 5, 24, 17, 0, tzinfo=UTC),
             ],
-        }
-    )
-    now = datetime(2026, 2, 21, 10, 15, tzinfo=timezone.utc)
-    created = await service.create_from_command(chat_id=123, command=cmd, now=now)
-
-    assert len(created) == 1
-    assert created[0].run_at == datetime(2026, 2, 21, 16, 0, tzinfo=timezone.utc)
-
-
-async def test_create_weekly_multi_day_generates_full_schedule() -> None:
-    repo = FakeRepository()
-    service = ReminderService(repo)
-    cmd = CreateRemindersCommand.model_validate(
-        {
-            "command": "create_reminders",
-            "reminders": [
-                {
-                    "text": "Тренировка",
-                    "run_at": "2026-03-03T19:00:00+00:00",
-                    "recurrence_rule": "FREQ=WEEKLY;BYDAY=TU,TH",
-                    "explicit_time_provided": True,
-                }
+            id="time-range-skips-past-slots",
+        ),
+        pytest.param(
+            {
+                "text": "Тренировка",
+                "run_at": "2026-03-03T19:00:00+00:00",
+                "recurrence_rule": "FREQ=WEEKLY;BYDAY=TU,TH",
+                "explicit_time_provided": True,
+            },
+            datetime(2026, 3, 2, 10, 0, tzinfo=UTC),
+            [
+                datetime(2026, 3, 3, 19, 0, tzinfo=UTC),
+                datetime(2026, 3, 5, 19, 0, tzinfo=UTC),
+                datetime(2026, 3, 10, 19, 0, tzinfo=UTC),
+                datetime(2026, 3, 12, 19, 0, tzinfo=UTC),
+                datetime(2026, 3, 17, 19, 0, tzinfo=UTC),
+                datetime(2026, 3, 19, 19, 0, tzinfo=UTC),
+                datetime(2026, 3, 24, 19, 0, tzinfo=UTC),
+                datetime(2026, 3, 26, 19, 0, tzinfo=UTC),
+                datetime(2026, 3, 31, 19, 0, tzinfo=UTC),
             ],
-        }
-    )
-    created = await service.create_from_command(
-        chat_id=123,
-        command=cmd,
-        now=datetime(2026, 3, 2, 10, 0, tzinfo=timezone.utc),
-    )
-    assert [item.run_at for item in created] == [
-        datetime(2026, 3, 3, 19, 0, tzinfo=timezone.utc),
-        datetime(2026, 3, 5, 19, 0, tzinfo=timezone.utc),
-        datetime(2026, 3, 10, 19, 0, tzinfo=timezone.utc),
-        datetime(2026, 3, 12, 19, 0, tzinfo=timezone.utc),
-        datetime(2026, 3, 17, 19, 0, tzinfo=timezone.utc),
-        datetime(2026, 3, 19, 19, 0, tzinfo=timezone.utc),
-        datetime(2026, 3, 24, 19, 0, tzinfo=timezone.utc),
-        datetime(2026, 3, 26, 19, 0, tzinfo=timezone.utc),
-        datetime(2026, 3, 31, 19, 0, tzinfo=timezone.utc),
-    ]
-
-
-async def test_create_weekdays_generates_only_business_days() -> None:
-    repo = FakeRepository()
-    service = ReminderService(repo)
-    cmd = CreateRemindersCommand.model_validate(
-        {
-            "command": "create_reminders",
-            "reminders": [
-                {
-                    "text": "Зарядка",
-                    "run_at": "2026-03-09T08:00:00+00:00",
-                    "recurrence_rule": "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR",
-                    "explicit_time_provided": True,
-                }
+            id="weekly-multi-day-full-schedule",
+        ),
+        pytest.param(
+            {
+                "text": "Отчет",
+                "run_at": "2026-03-04T10:00:00+00:00",
+                "recurrence_rule": "FREQ=WEEKLY;INTERVAL=2;BYDAY=WE",
+                "explicit_time_provided": True,
+            },
+            datetime(2026, 3, 3, 10, 0, tzinfo=UTC),
+            [
+                datetime(2026, 3, 4, 10, 0, tzinfo=UTC),
+                datetime(2026, 3, 18, 10, 0, tzinfo=UTC),
             ],
-        }
-    )
-    created = await service.create_from_command(
-        chat_id=123,
-        command=cmd,
-        now=datetime(2026, 3, 8, 10, 0, tzinfo=timezone.utc),
-    )
-    assert [item.run_at.date().isoformat() for item in created] == [
-        "2026-03-09",
-        "2026-03-10",
-        "2026-03-11",
-        "2026-03-12",
-        "2026-03-13",
-        "2026-03-16",
-        "2026-03-17",
-        "2026-03-18",
-        "2026-03-19",
-        "2026-03-20",
-        "2026-03-23",
-        "2026-03-24",
-        "2026-03-25",
-        "2026-03-26",
-        "2026-03-27",
-        "2026-03-30",
-        "2026-03-31",
-    ]
-
-
-async def test_create_every_two_weeks_generates_interval_schedule() -> None:
-    repo = FakeRepository()
-    service = ReminderService(repo)
-    cmd = CreateRemindersCommand.model_validate(
-        {
-            "command": "create_reminders",
-            "reminders": [
-                {
-                    "text": "Отчет",
-                    "run_at": "2026-03-04T10:00:00+00:00",
-                    "recurrence_rule": "FREQ=WEEKLY;INTERVAL=2;BYDAY=WE",
-                    "explicit_time_provided": True,
-                }
+            id="every-two-weeks-interval-schedule",
+        ),
+        pytest.param(
+            {
+                "text": "Зарядка",
+                "run_at": "2026-03-09T08:00:00+00:00",
+                "recurrence_rule": "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR",
+                "explicit_time_provided": True,
+            },
+            datetime(2026, 3, 8, 10, 0, tzinfo=UTC),
+            [
+                "2026-03-09",
+                "2026-03-10",
+                "2026-03-11",
+                "2026-03-12",
+                "2026-03-13",
+                "2026-03-16",
+                "2026-03-17",
+                "2026-03-18",
+                "2026-03-19",
+                "2026-03-20",
+                "2026-03-23",
+                "2026-03-24",
+                "2026-03-25",
+                "2026-03-26",
+                "2026-03-27",
+                "2026-03-30",
+                "2026-03-31",
             ],
-        }
-    )
-    created = await service.create_from_command(
-        chat_id=123,
-        command=cmd,
-        now=datetime(2026, 3, 3, 10, 0, tzinfo=timezone.utc),
-    )
-    assert [item.run_at for item in created] == [
-        datetime(2026, 3, 4, 10, 0, tzinfo=timezone.utc),
-        datetime(2026, 3, 18, 10, 0, tzinfo=timezone.utc),
-    ]
-
-
-async def test_create_daily_with_explicit_until_generates_inclusive_dates() -> None:
-    repo = FakeRepository()
-    service = ReminderService(repo)
-    cmd = CreateRemindersCommand.model_validate(
-        {
-            "command": "create_reminders",
-            "reminders": [
-                {
-                    "text": "Вода",
-                    "run_at": "2026-03-28T09:00:00+00:00",
-                    "recurrence_rule": "FREQ=DAILY;UNTIL=2026-04-01T09:00:00+00:00",
-                    "explicit_time_provided": True,
-                }
+            id="weekdays-only-business-days",
+        ),
+        pytest.param(
+            {
+                "text": "Вода",
+                "run_at": "2026-03-28T09:00:00+00:00",
+                "recurrence_rule": "FREQ=DAILY;UNTIL=2026-04-01T09:00:00+00:00",
+                "explicit_time_provided": True,
+            },
+            datetime(2026, 3, 27, 10, 0, tzinfo=UTC),
+            [
+                "2026-03-28",
+                "2026-03-29",
+                "2026-03-30",
+                "2026-03-31",
+                "2026-04-01",
             ],
-        }
-    )
-    created = await service.create_from_command(
-        chat_id=123,
-        command=cmd,
-        now=datetime(2026, 3, 27, 10, 0, tzinfo=timezone.utc),
-    )
-    assert [item.run_at.date().isoformat() for item in created] == [
-        "2026-03-28",
-        "2026-03-29",
-        "2026-03-30",
-        "2026-03-31",
-        "2026-04-01",
-    ]
+            id="daily-explicit-until-inclusive",
+        ),
+    ],
+)
+async def test_create_recurring_generates_expected_schedule(
+    service: ReminderService, reminder: dict, now: datetime, expected: list
+) -> None:
+    created = await service.create_from_command(chat_id=123, command=_create_cmd(reminder), now=now)
+
+    if expected and isinstance(expected[0], str):
+        assert [item.run_at.date().isoformat() for item in created] == expected
+    else:
+        assert [item.run_at for item in created] == expected